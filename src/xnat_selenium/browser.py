@@ -3,7 +3,8 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
-from typing import ClassVar, Dict, Type
+from types import MappingProxyType
+from typing import ClassVar, Mapping, Type
 
 
 @dataclass(frozen=True)
@@ -24,30 +25,37 @@ class FirefoxSupport(BaseBrowserSupport):
 class BrowserSupport:
     """Cache for browser support helpers used by the selenium suite."""
 
-    _ALIASES: ClassVar[Dict[str, Type[BaseBrowserSupport]]] = {
-        "chrome": ChromeSupport,
-        "google chrome": ChromeSupport,
-        "mozilla firefox": FirefoxSupport,
-        "firefox": FirefoxSupport,
-        "ff": FirefoxSupport,
-    }
+    _ALIASES: ClassVar[Mapping[str, Type[BaseBrowserSupport]]] = MappingProxyType(
+        {
+            "chrome": ChromeSupport,
+            "google chrome": ChromeSupport,
+            "mozilla firefox": FirefoxSupport,
+            "firefox": FirefoxSupport,
+            "ff": FirefoxSupport,
+        }
+    )
+    # Precomputed once; the alias table is static so the error message never
+    # needs to be rebuilt per call.
+    _KNOWN_NAMES: ClassVar[str] = ", ".join(
+        sorted({support.name for support in _ALIASES.values()})
+    )
     cached_browser_support: ClassVar[Type[BaseBrowserSupport] | None] = None
 
     @classmethod
     def cache_browser(cls, browser_key: str) -> None:
         """Cache the browser support class for ``browser_key``."""
 
-        normalized = browser_key.strip().lower()
-        support_cls = cls._ALIASES.get(normalized)
+        # Fast-path keys that are already normalized before paying for
+        # strip/lower allocations.
+        support_cls = cls._ALIASES.get(browser_key)
+        if support_cls is None:
+            support_cls = cls._ALIASES.get(browser_key.strip().lower())
         if support_cls is None:
-            known = sorted({support.name for support in cls._ALIASES.values()})
-            options = ", ".join(known)
             raise RuntimeError(
-                f"Unknown browser: {browser_key}. Available browser helpers: {options}"
+                f"Unknown browser: {browser_key}. Available browser helpers: {cls._KNOWN_NAMES}"
             )
         cls.cached_browser_support = support_cls
 
     @classmethod
     def clear_cache(cls) -> None:
         cls.cached_browser_support = None
-
@@ -1,10 +1,32 @@
 """Configuration helpers for the XNAT Selenium test-suite."""
 from __future__ import annotations
 
+import functools
 import os
 from dataclasses import dataclass
 
-from .mock_driver import is_mock_base_url
+# Falsey spellings for XNAT_HEADLESS, matched case-insensitively to mirror
+# the accepted truthy spellings in ``_env_flag``.
+_HEADLESS_FALSE = frozenset({"0", "false", "no", "off", ""})
+
+
+@functools.lru_cache(maxsize=None)
+def _env(name: str) -> str | None:
+    """Read an environment variable once per process.
+
+    XNAT settings are not expected to change mid-run, so repeated fixture
+    invocations can reuse the cached value instead of hitting ``os.environ``.
+    """
+
+    return os.environ.get(name)
+
+
+def clear_env_cache() -> None:
+    """Reset cached environment lookups (for tests that mutate ``os.environ``)."""
+
+    global _USE_MOCK_ENV
+    _env.cache_clear()
+    _USE_MOCK_ENV = _env_flag(_env("XNAT_USE_MOCK"))
 
 
 def _env_flag(value: str | None) -> bool:
@@ -13,6 +35,10 @@ def _env_flag(value: str | None) -> bool:
     return value.lower() in {"1", "true", "yes", "on"}
 
 
+# Evaluated once at import; refreshed only through ``clear_env_cache``.
+_USE_MOCK_ENV = _env_flag(_env("XNAT_USE_MOCK"))
+
+
 @dataclass(frozen=True)
 class XnatConfig:
     """Container for runtime configuration values."""
@@ -24,11 +50,17 @@ class XnatConfig:
 
     @classmethod
     def from_env(cls, *, base_url: str | None = None, username: str | None = None, password: str | None = None, headless: bool | None = None) -> "XnatConfig":
-        requested_mock = _env_flag(os.getenv("XNAT_USE_MOCK")) or (base_url is not None and is_mock_base_url(base_url))
+        requested_mock = _USE_MOCK_ENV
+        if not requested_mock and base_url is not None:
+            # Imported lazily so production config loading does not pay for the
+            # mock driver (and its selenium imports) unless a URL is inspected.
+            from .mock_driver import is_mock_base_url
+
+            requested_mock = is_mock_base_url(base_url)
 
-        resolved_base_url = base_url or os.getenv("XNAT_BASE_URL")
-        resolved_username = username or os.getenv("XNAT_USERNAME")
-        env_password = os.getenv("XNAT_PASSWORD")
+        resolved_base_url = base_url or _env("XNAT_BASE_URL")
+        resolved_username = username or _env("XNAT_USERNAME")
+        env_password = _env("XNAT_PASSWORD")
         resolved_password = password if password is not None else env_password
 
         if requested_mock:
@@ -36,7 +68,7 @@ class XnatConfig:
             resolved_username = resolved_username or "admin"
             resolved_password = resolved_password if resolved_password is not None else "admin"
 
-        resolved_headless = headless if headless is not None else os.getenv("XNAT_HEADLESS", "1") not in {"0", "false", "False"}
+        resolved_headless = headless if headless is not None else (_env("XNAT_HEADLESS") or "1").lower() not in _HEADLESS_FALSE
 
         if not resolved_base_url:
             raise ValueError("XNAT base URL must be provided via --base-url or XNAT_BASE_URL")
@@ -16,9 +16,11 @@ explicitly so the page objects remain unchanged.
 """
 from __future__ import annotations
 
-from dataclasses import dataclass
-from typing import Callable, Dict, List, Optional, Tuple
-from urllib.parse import parse_qs, urlparse
+import functools
+import sys
+from dataclasses import dataclass, field
+from typing import Callable, Dict, Iterable, List, Optional, Tuple
+from urllib.parse import unquote_plus, urlsplit
 
 from selenium.common.exceptions import NoSuchElementException
 from selenium.webdriver.common.by import By
@@ -26,37 +28,207 @@ from selenium.webdriver.common.by import By
 Locator = Tuple[str, str]
 
 
+def _locator_set(*locators: Locator) -> frozenset:
+    """Build a locator set with interned value strings.
+
+    Locator tuples are hashed and compared on every element lookup; interning
+    the CSS/name strings lets those checks collapse to pointer comparisons.
+    New locators added to the tables below should stay routed through here.
+    """
+
+    return frozenset((by, sys.intern(value)) for by, value in locators)
+
+# ----------------------------------------------------------------------
+# Locator aliases accepted by each mock page.  Hoisted to module-level
+# frozensets so element resolution does not rebuild set literals per lookup.
+# ----------------------------------------------------------------------
+_LOGIN_USERNAME_LOCATORS = _locator_set(
+    (By.NAME, "login"),
+    (By.CSS_SELECTOR, "input[name='login'], input[name='username']"),
+)
+_LOGIN_SUBMIT_LOCATORS = _locator_set(
+    (By.CSS_SELECTOR, "form button[type='submit'], form input[type='submit']"),
+    (By.CSS_SELECTOR, "form button[type='submit'], form input[type='submit'], button#loginButton"),
+)
+_LOGIN_ERROR_LOCATORS = _locator_set(
+    (By.CSS_SELECTOR, ".alert-error, .message-error, .error"),
+    (By.CSS_SELECTOR, ".message, .alert-error, .message-error, .error"),
+    (By.CSS_SELECTOR, ".alert.alert-danger, .alert.alert-error, .xnat-alert-error"),
+    (By.ID, "loginMessage"),
+    (By.ID, "login-error"),
+    (By.CSS_SELECTOR, "[role='alert'], [data-testid='login-error']"),
+)
+_DASHBOARD_WELCOME_LOCATORS = _locator_set(
+    (By.CSS_SELECTOR, "#page-content h1, .welcome-message"),
+    (By.CSS_SELECTOR, "#main_nav, body"),
+)
+_PROJECT_CREATE_LOCATORS = _locator_set(
+    (By.CSS_SELECTOR, "a#create-project, a[href*='CreateProject']"),
+    (By.CSS_SELECTOR, "a[href*='add_xnat_projectData']"),
+)
+_PROJECT_ID_LOCATORS = _locator_set(
+    (By.NAME, "ID"),
+    (By.NAME, "xnat:projectData/ID"),
+)
+_PROJECT_NAME_LOCATORS = _locator_set(
+    (By.NAME, "name"),
+    (By.NAME, "xnat:projectData/name"),
+)
+_PROJECT_DESCRIPTION_LOCATORS = _locator_set(
+    (By.NAME, "description"),
+    (By.NAME, "xnat:projectData/description"),
+)
+_PROJECT_SUBMIT_LOCATORS = _locator_set(
+    (By.CSS_SELECTOR, "form button[type='submit'], form input[type='submit']"),
+    (
+        By.CSS_SELECTOR,
+        "input[name='eventSubmit_doPerform'], input[value*='Create Project'], button[type='submit'], input[type='submit']",
+    ),
+)
+_SUBJECT_ADD_LOCATORS = _locator_set(
+    (By.CSS_SELECTOR, "a[href*='AddSubject'], button#create-subject"),
+    (By.CSS_SELECTOR, "a[href*='xdataction/edit/search_element/xnat%3AsubjectData']"),
+)
+_SUBJECT_LABEL_LOCATORS = _locator_set(
+    (By.NAME, "label"),
+    (By.NAME, "xnat:subjectData/label"),
+)
+_SUBJECT_SPECIES_LOCATORS = _locator_set(
+    (By.NAME, "species"),
+    (By.NAME, "xnat:subjectData/demographics[@xsi:type=xnat:demographicData]/species"),
+)
+_ENTITY_SUBMIT_LOCATORS = _locator_set(
+    (By.CSS_SELECTOR, "form button[type='submit'], form input[type='submit']"),
+    (
+        By.CSS_SELECTOR,
+        "input[name='eventSubmit_doInsert'], input[value*='Submit'], button[type='submit'], input[type='submit']",
+    ),
+)
+_EXPERIMENT_ADD_LOCATORS = _locator_set(
+    (By.CSS_SELECTOR, "a[href*='AddExperiment'], button#create-session"),
+    (By.CSS_SELECTOR, "a[href*='add_experiment'], a[href*='xdataction/edit'][href*='experiment']"),
+)
+_EXPERIMENT_LABEL_LOCATORS = _locator_set(
+    (By.NAME, "label"),
+    (By.NAME, "xnat:mrSessionData/label"),
+)
+_EXPERIMENT_MODALITY_LOCATORS = _locator_set(
+    (By.NAME, "modality"),
+    (By.NAME, "xnat:mrSessionData/modality"),
+)
+_PROJECT_ROW_LOCATORS = _locator_set(
+    (By.CSS_SELECTOR, "table.project-list tbody tr"),
+    (By.CSS_SELECTOR, "table.xnat-table tbody tr[data-id]"),
+    (By.CSS_SELECTOR, "table.xnat-table tbody tr[data-id], table tbody tr"),
+)
+_SUBJECT_ROW_LOCATORS = _locator_set(
+    (By.CSS_SELECTOR, "table.subject-list tbody tr"),
+    (By.CSS_SELECTOR, "table.xnat-table tbody tr[data-id]"),
+    (By.CSS_SELECTOR, "table.xnat-table tbody tr[data-id], table tbody tr"),
+)
+# Chrome elements available on every authenticated page, mapped to the driver
+# method that builds them.  A module-level dict keeps the per-find cost to a
+# single ``dict.get`` instead of a locator comparison cascade.
+_SHARED_AUTH_FACTORIES: Dict[Tuple[str, str], str] = {
+    (By.CSS_SELECTOR, "#user-box, .user-menu"): "_make_user_menu",
+    (By.CSS_SELECTOR, "a[href*='Logout']"): "_make_logout_link",
+    (By.ID, "logout_user"): "_make_logout_button",
+    (By.ID, "browse-projects-menu-item"): "_make_static",
+}
+_EXPERIMENT_ROW_LOCATORS = _locator_set(
+    (By.CSS_SELECTOR, "table.experiment-list tbody tr"),
+    (By.CSS_SELECTOR, "table.xnat-table tbody tr[data-id]"),
+    (By.CSS_SELECTOR, "table.xnat-table tbody tr[data-id], table tbody tr"),
+)
+
+
+@functools.lru_cache(maxsize=128)
+def _split_path_query(url: str) -> Tuple[str, str]:
+    """Extract the path and query from ``url`` without a SplitResult.
+
+    The mock's URLs are simple enough that ``str.find`` plus slicing covers
+    them; anything without a ``scheme://`` prefix falls back to ``urlsplit``.
+    Tests re-hit the same handful of endpoints, so results are memoized; the
+    bounded cache keeps runs that fabricate many unique URLs from leaking.
+    """
+
+    scheme_end = url.find("://")
+    if scheme_end == -1:
+        parsed = urlsplit(url)
+        return parsed.path or "/", parsed.query
+    start = url.find("/", scheme_end + 3)
+    if start == -1:
+        return "/", ""
+    fragment = url.find("#", start)
+    if fragment != -1:
+        url = url[:fragment]
+    qmark = url.find("?", start)
+    if qmark == -1:
+        return url[start:], ""
+    return url[start:qmark], url[qmark + 1 :]
+
+
+def _query_param(query: str, name: str) -> Optional[str]:
+    """Return the first value for ``name`` without building a parse_qs dict."""
+
+    if not query:
+        return None
+    needle = name + "="
+    for part in query.split("&"):
+        if part.startswith(needle):
+            return unquote_plus(part[len(needle) :])
+    return None
+
+
 def is_mock_base_url(url: str) -> bool:
     """Return ``True`` when the provided ``url`` targets the mock driver."""
 
     if not url:
         return False
-    normalized = url.strip().lower()
-    return normalized.startswith("mock://") or normalized == "mock"
+    # Only pay for a full strip when the URL actually has edge whitespace;
+    # lowering just the prefix avoids materializing the whole normalized URL.
+    candidate = url if url[0] > " " and url[-1] > " " else url.strip()
+    if not candidate:
+        return False
+    return candidate[:7].lower() == "mock://" or candidate.lower() == "mock"
 
 
-@dataclass
+@dataclass(slots=True)
 class _Project:
     identifier: str
     name: str
     description: str | None = None
     aliases: tuple[str, ...] = ()
     keywords: tuple[str, ...] = ()
+    display: str = field(init=False, default="")
 
+    def __post_init__(self) -> None:
+        # Precomputed row text so `.text` is an attribute read instead of a
+        # join over the populated fields on every access.
+        self.display = " | ".join(part for part in (self.identifier, self.name, self.description) if part)
 
-@dataclass
+
+@dataclass(slots=True)
 class _Subject:
     label: str
     species: str | None = None
+    display: str = field(init=False, default="")
+
+    def __post_init__(self) -> None:
+        self.display = " | ".join(part for part in (self.label, self.species) if part)
 
 
-@dataclass
+@dataclass(slots=True)
 class _Experiment:
     label: str
     modality: str | None = None
+    display: str = field(init=False, default="")
+
+    def __post_init__(self) -> None:
+        self.display = " | ".join(part for part in (self.label, self.modality) if part)
 
 
-@dataclass
+@dataclass(slots=True)
 class _UiState:
     """Container tracking mock UI state."""
 
@@ -81,9 +253,54 @@ class _UiState:
     current_subject: Optional[str] = None
 
 
+class _SingleUserMap:
+    """Credential store that defers dict allocation until a second user.
+
+    Every driver starts with exactly one known account, and most never gain
+    another, so lookups run against two slots; a real dict is only
+    materialized if extra credentials are registered.
+    """
+
+    __slots__ = ("_username", "_password", "_extra")
+
+    def __init__(self, username: str, password: str) -> None:
+        self._username = username
+        self._password = password
+        self._extra: Optional[Dict[str, str]] = None
+
+    def get(self, username: str) -> Optional[str]:
+        if username == self._username:
+            return self._password
+        if self._extra is not None:
+            return self._extra.get(username)
+        return None
+
+    def __setitem__(self, username: str, password: str) -> None:
+        if username == self._username:
+            self._password = password
+            return
+        if self._extra is None:
+            self._extra = {}
+        self._extra[username] = password
+
+
 class MockWebElement:
     """Very small stand-in for Selenium's ``WebElement``."""
 
+    # Row rendering creates these in bulk; slots drop the per-instance
+    # ``__dict__`` and speed up attribute access.  The ``text`` property is a
+    # class attribute and therefore coexists with slots.
+    __slots__ = (
+        "_locator",
+        "_text_getter",
+        "_on_click",
+        "_on_send_keys",
+        "_on_clear",
+        "_value",
+        "_is_displayed_getter",
+        "_attributes",
+    )
+
     def __init__(
         self,
         *,
@@ -102,7 +319,9 @@ class MockWebElement:
         self._on_clear = on_clear
         self._value: str = ""
         self._is_displayed_getter = is_displayed_getter
-        self._attributes = {k.lower(): v for k, v in (attributes or {}).items()}
+        # Most elements never receive attributes; keep ``None`` instead of an
+        # empty dict so ``get_attribute`` can short-circuit without a lookup.
+        self._attributes = {k.lower(): v for k, v in attributes.items()} if attributes else None
 
     # ------------------------------------------------------------------
     # Selenium compatibility helpers
@@ -132,13 +351,17 @@ class MockWebElement:
         return True
 
     def get_attribute(self, name: str) -> str:
+        # "value" dominates the suite's attribute reads; compare before paying
+        # for ``str.lower`` on the hot path.
+        if name == "value":
+            return self._value
         key = name.lower()
         if key == "value":
             return self._value
         if key in {"textcontent", "innertext"}:
             return self.text
-        if key == "validationmessage":
-            return self._attributes.get(key, "")
+        if self._attributes is None:
+            return ""
         return self._attributes.get(key, "")
 
     @property
@@ -156,11 +379,25 @@ class MockWebDriver:
         self._default_username = username
         self._default_password = password
         self._ui = _UiState()
-        self._projects: List[_Project] = []
-        self._subjects: Dict[str, List[_Subject]] = {}
-        self._experiments: Dict[Tuple[str, str], List[_Experiment]] = {}
-        self._users: Dict[str, str] = {username: password}
+        # Keyed by identifier/label so duplicate submits are a single ordered
+        # dict assignment instead of a filter-and-append list rebuild.
+        self._projects: Dict[str, _Project] = {}
+        self._subjects: Dict[str, Dict[str, _Subject]] = {}
+        self._experiments: Dict[Tuple[str, str], Dict[str, _Experiment]] = {}
+        self._users = _SingleUserMap(username, password)
         self._closed = False
+        self._element_factories = self._build_element_factories()
+        # Stateless chrome elements (menus, banners, static links) are reused
+        # across lookups; form fields are never cached because they carry
+        # per-interaction ``_value`` state.
+        self._element_cache: Dict[Tuple[str, Locator], MockWebElement] = {}
+        self._shared_element_cache: Dict[Locator, MockWebElement] = {}
+        # Row-element lists are cached per table and invalidated through
+        # generation counters bumped on every submit.
+        self._projects_gen = 0
+        self._subjects_gen: Dict[str, int] = {}
+        self._experiments_gen: Dict[Tuple[str, str], int] = {}
+        self._rows_cache: Dict[Tuple[object, Locator], Tuple[int, List[MockWebElement]]] = {}
 
     # ------------------------------------------------------------------
     # Selenium WebDriver API surface
@@ -168,74 +405,117 @@ class MockWebDriver:
     def get(self, url: str) -> None:
         if self._closed:
             return
-        parsed = urlparse(url)
-        path = parsed.path or "/"
+        path, query = _split_path_query(url)
+        path = path or "/"
         self._ui.current_url = url
-        if path == "/":
-            if self._ui.logged_in_user:
-                self._ui.current_page = "dashboard"
-                self._ui.current_url = f"{self.base_url}/"
-            else:
-                self._navigate_to_login()
-            return
-        if path == "/app/template/Login.vm":
+        handler = self._EXACT_PATHS.get(path)
+        if handler is None:
+            for prefix, candidate in self._PREFIX_PATHS:
+                if path.startswith(prefix):
+                    handler = candidate
+                    break
+        if handler is None:
+            raise NoSuchElementException(f"Unsupported navigation path: {path}")
+        handler(self, path, query)
+
+    # ------------------------------------------------------------------
+    # Navigation handlers dispatched from ``get``
+    # ------------------------------------------------------------------
+    def _goto_root(self, path: str, query: str) -> None:
+        ui = self._ui
+        if ui.logged_in_user:
+            ui.current_page = "dashboard"
+            ui.current_url = f"{self.base_url}/"
+        else:
             self._navigate_to_login()
-            return
-        if path == "/app/template/XDATScreen_select_project.vm":
-            self._require_authentication()
-            self._ui.current_page = "dashboard"
-            return
-        if path == "/app/template/XDATScreen_manage_projects.vm":
-            self._require_authentication()
-            self._ui.current_page = "projects"
-            self._ui.project_form_visible = False
-            return
-        if path.startswith("/app/action/DisplayItemAction/search_element/subject"):
-            self._require_authentication()
-            project_identifier = path.split("/")[-1]
-            self._ui.current_page = "subjects"
-            self._ui.current_project = project_identifier
-            self._ui.subject_form_visible = False
-            self._subjects.setdefault(project_identifier, [])
-            return
-        if path.startswith("/app/action/DisplayItemAction/search_element/experiment"):
-            self._require_authentication()
-            project_identifier = path.split("/")[-1]
-            subject_label = parse_qs(parsed.query).get("subject", [None])[0]
-            if subject_label is None:
-                raise NoSuchElementException("Subject must be specified")
-            self._ui.current_page = "experiments"
-            self._ui.current_project = project_identifier
-            self._ui.current_subject = subject_label
-            self._ui.experiment_form_visible = False
-            self._experiments.setdefault((project_identifier, subject_label), [])
-            return
-        if path.startswith("/data/projects"):
-            self._require_authentication()
-            parts = [part for part in path.strip("/").split("/") if part]
-            # Expect paths like /data/projects/<project>[/subjects/<subject>]
-            if len(parts) >= 3 and parts[0] == "data" and parts[1] == "projects":
-                project_identifier = parts[2]
-                self._subjects.setdefault(project_identifier, [])
-                if len(parts) >= 5 and parts[3] == "subjects":
-                    subject_label = parts[4]
-                    self._ui.current_page = "experiments"
-                    self._ui.current_project = project_identifier
-                    self._ui.current_subject = subject_label
-                    self._ui.experiment_form_visible = False
-                    self._experiments.setdefault((project_identifier, subject_label), [])
+
+    def _goto_login_page(self, path: str, query: str) -> None:
+        self._navigate_to_login()
+
+    def _goto_dashboard(self, path: str, query: str) -> None:
+        self._require_authentication()
+        self._ui.current_page = "dashboard"
+
+    def _goto_projects_page(self, path: str, query: str) -> None:
+        self._require_authentication()
+        self._ui.current_page = "projects"
+        self._ui.project_form_visible = False
+
+    def _goto_subjects_page(self, path: str, query: str) -> None:
+        self._require_authentication()
+        project_identifier = path.split("/")[-1]
+        ui = self._ui
+        ui.current_page = "subjects"
+        ui.current_project = project_identifier
+        ui.subject_form_visible = False
+        self._subjects.setdefault(project_identifier, {})
+
+    def _goto_experiments_page(self, path: str, query: str) -> None:
+        self._require_authentication()
+        project_identifier = path.split("/")[-1]
+        subject_label = _query_param(query, "subject")
+        if subject_label is None:
+            raise NoSuchElementException("Subject must be specified")
+        ui = self._ui
+        ui.current_page = "experiments"
+        ui.current_project = project_identifier
+        ui.current_subject = subject_label
+        ui.experiment_form_visible = False
+        self._experiments.setdefault((project_identifier, subject_label), {})
+
+    def _goto_data_projects(self, path: str, query: str) -> None:
+        self._require_authentication()
+        ui = self._ui
+        # Expect paths like /data/projects/<project>[/subjects/<subject>];
+        # dispatch guarantees the "/data/projects" prefix, so slice the
+        # remaining segments directly instead of building split lists.
+        rest = path[len("/data/projects") :].rstrip("/")
+        if rest.startswith("/"):
+            pid_end = rest.find("/", 1)
+            if pid_end == -1:
+                project_identifier = rest[1:]
+                tail = ""
+            else:
+                project_identifier = rest[1:pid_end]
+                tail = rest[pid_end:]
+            if project_identifier:
+                self._subjects.setdefault(project_identifier, {})
+                subject_label = tail[len("/subjects/") :] if tail.startswith("/subjects/") else ""
+                if subject_label:
+                    ui.current_page = "experiments"
+                    ui.current_project = project_identifier
+                    ui.current_subject = subject_label
+                    ui.experiment_form_visible = False
+                    self._experiments.setdefault((project_identifier, subject_label), {})
                 else:
-                    self._ui.current_page = "subjects"
-                    self._ui.current_project = project_identifier
-                    self._ui.subject_form_visible = False
+                    ui.current_page = "subjects"
+                    ui.current_project = project_identifier
+                    ui.subject_form_visible = False
                 return
         raise NoSuchElementException(f"Unsupported navigation path: {path}")
 
+    # Dispatch tables so navigation is a dict probe (plus a short prefix scan)
+    # rather than an if/elif ladder per ``get`` call.
+    _EXACT_PATHS = {
+        "/": _goto_root,
+        "/app/template/Login.vm": _goto_login_page,
+        "/app/template/XDATScreen_select_project.vm": _goto_dashboard,
+        "/app/template/XDATScreen_manage_projects.vm": _goto_projects_page,
+    }
+    _PREFIX_PATHS = (
+        ("/app/action/DisplayItemAction/search_element/subject", _goto_subjects_page),
+        ("/app/action/DisplayItemAction/search_element/experiment", _goto_experiments_page),
+        ("/data/projects", _goto_data_projects),
+    )
+
     def find_element(self, by: str, value: str) -> MockWebElement:
         locator = (by, value)
         element = self._resolve_element(locator)
+        # Error messages (and the exception objects carrying them) are only
+        # constructed on the miss branches; the found path does no formatting.
         if element is None:
-            raise NoSuchElementException(f"Unable to locate element {locator} on page {self._ui.current_page}")
+            page = self._ui.current_page
+            raise NoSuchElementException(f"Unable to locate element {locator} on page {page}")
         if not element.is_displayed():
             raise NoSuchElementException(f"Element {locator} is not visible")
         return element
@@ -243,6 +523,10 @@ class MockWebDriver:
     def find_elements(self, by: str, value: str) -> List[MockWebElement]:
         locator = (by, value)
         elements = self._resolve_elements(locator)
+        # Row elements never register a visibility getter, so the cached list
+        # can be returned as-is without an N-element filter pass.
+        if elements and elements[0]._is_displayed_getter is None:
+            return elements
         return [element for element in elements if element.is_displayed()]
 
     def implicitly_wait(self, _seconds: float) -> None:  # pragma: no cover - no-op for compatibility
@@ -261,310 +545,285 @@ class MockWebDriver:
         shared = self._shared_authenticated_element(locator)
         if shared is not None:
             return shared
-        page = self._ui.current_page
-        if page == "login":
-            return self._login_element(locator)
-        if page == "dashboard":
-            return self._dashboard_element(locator)
-        if page == "projects":
-            return self._projects_element(locator)
-        if page == "subjects":
-            return self._subjects_element(locator)
-        if page == "experiments":
-            return self._experiments_element(locator)
-        return None
+        key = (self._ui.current_page, locator)
+        factory = self._element_factories.get(key)
+        if factory is None:
+            return None
+        if factory.__func__ in self._CACHEABLE_FACTORIES:
+            element = self._element_cache.get(key)
+            if element is None:
+                element = factory(locator)
+                self._element_cache[key] = element
+            return element
+        return factory(locator)
 
     def _shared_authenticated_element(self, locator: Locator) -> MockWebElement | None:
         if not self._ui.logged_in_user:
             return None
-        user_menu_locators = {
-            (By.CSS_SELECTOR, "#user-box, .user-menu"),
-        }
-        if locator in user_menu_locators:
-            return MockWebElement(locator=locator, on_click=self._open_user_menu)
-        if locator == (By.CSS_SELECTOR, "a[href*='Logout']"):
-            return MockWebElement(
-                locator=locator,
-                on_click=self._logout,
-                is_displayed_getter=lambda: self._ui.user_menu_open,
-            )
-        if locator == (By.ID, "logout_user"):
-            return MockWebElement(locator=locator, on_click=self._logout)
-        if locator == (By.ID, "browse-projects-menu-item"):
-            return MockWebElement(locator=locator)
-        return None
+        cached = self._shared_element_cache.get(locator)
+        if cached is not None:
+            return cached
+        factory_name = _SHARED_AUTH_FACTORIES.get(locator)
+        if factory_name is None:
+            return None
+        element = getattr(self, factory_name)(locator)
+        self._shared_element_cache[locator] = element
+        return element
+
+    def _make_user_menu(self, locator: Locator) -> MockWebElement:
+        return MockWebElement(locator=locator, on_click=self._open_user_menu)
+
+    def _make_logout_link(self, locator: Locator) -> MockWebElement:
+        return MockWebElement(
+            locator=locator,
+            on_click=self._logout,
+            is_displayed_getter=self._user_menu_is_open,
+        )
+
+    def _make_logout_button(self, locator: Locator) -> MockWebElement:
+        return MockWebElement(locator=locator, on_click=self._logout)
 
     def _resolve_elements(self, locator: Locator) -> List[MockWebElement]:
-        page = self._ui.current_page
-        project_row_locators = {
-            (By.CSS_SELECTOR, "table.project-list tbody tr"),
-            (By.CSS_SELECTOR, "table.xnat-table tbody tr[data-id]"),
-            (By.CSS_SELECTOR, "table.xnat-table tbody tr[data-id], table tbody tr"),
-        }
-        if page == "projects" and locator in project_row_locators:
-            return [
-                MockWebElement(
-                    locator=locator,
-                    text_getter=lambda proj=proj: " | ".join(
-                        filter(
-                            None,
-                            [
-                                proj.identifier,
-                                proj.name,
-                                proj.description,
-                            ],
-                        )
-                    ),
-                )
-                for proj in self._projects
-            ]
-        subject_row_locators = {
-            (By.CSS_SELECTOR, "table.subject-list tbody tr"),
-            (By.CSS_SELECTOR, "table.xnat-table tbody tr[data-id]"),
-            (By.CSS_SELECTOR, "table.xnat-table tbody tr[data-id], table tbody tr"),
-        }
-        if page == "subjects" and locator in subject_row_locators:
-            project_identifier = self._ui.current_project or ""
-            subjects = self._subjects.get(project_identifier, [])
-            return [
-                MockWebElement(
-                    locator=locator,
-                    text_getter=lambda subj=subj: " | ".join(
-                        filter(
-                            None,
-                            [
-                                subj.label,
-                                subj.species,
-                            ],
-                        )
-                    ),
-                )
-                for subj in subjects
-            ]
-        experiment_row_locators = {
-            (By.CSS_SELECTOR, "table.experiment-list tbody tr"),
-            (By.CSS_SELECTOR, "table.xnat-table tbody tr[data-id]"),
-            (By.CSS_SELECTOR, "table.xnat-table tbody tr[data-id], table tbody tr"),
-        }
-        if page == "experiments" and locator in experiment_row_locators:
-            key = (self._ui.current_project or "", self._ui.current_subject or "")
-            experiments = self._experiments.get(key, [])
-            return [
-                MockWebElement(
-                    locator=locator,
-                    text_getter=lambda exp=exp: " | ".join(
-                        filter(
-                            None,
-                            [
-                                exp.label,
-                                exp.modality,
-                            ],
-                        )
-                    ),
-                )
-                for exp in experiments
-            ]
+        # Alias the UI state once; repeated ``self._ui.X`` loads are two
+        # attribute lookups apiece in this per-find hot path.
+        ui = self._ui
+        page = ui.current_page
+        if page == "projects" and locator in _PROJECT_ROW_LOCATORS:
+            return self._cached_rows("projects", locator, self._projects_gen, self._projects.values())
+        if page == "subjects" and locator in _SUBJECT_ROW_LOCATORS:
+            project_identifier = ui.current_project or ""
+            return self._cached_rows(
+                ("subjects", project_identifier),
+                locator,
+                self._subjects_gen.get(project_identifier, 0),
+                self._subjects.get(project_identifier, {}).values(),
+            )
+        if page == "experiments" and locator in _EXPERIMENT_ROW_LOCATORS:
+            key = (ui.current_project or "", ui.current_subject or "")
+            return self._cached_rows(
+                ("experiments", key),
+                locator,
+                self._experiments_gen.get(key, 0),
+                self._experiments.get(key, {}).values(),
+            )
         return []
 
+    def _cached_rows(
+        self, scope: object, locator: Locator, generation: int, records: Iterable
+    ) -> List[MockWebElement]:
+        cache_key = (scope, locator)
+        cached = self._rows_cache.get(cache_key)
+        if cached is not None and cached[0] == generation:
+            return cached[1]
+        rows = [
+            MockWebElement(locator=locator, text_getter=lambda record=record: record.display)
+            for record in records
+        ]
+        self._rows_cache[cache_key] = (generation, rows)
+        return rows
+
     # ------------------------------------------------------------------
     # Page specific element factories
     # ------------------------------------------------------------------
-    def _login_element(self, locator: Locator) -> MockWebElement | None:
-        username_locators = {
-            (By.NAME, "login"),
-            (By.CSS_SELECTOR, "input[name='login'], input[name='username']"),
-        }
-        if locator in username_locators:
-            return MockWebElement(
-                locator=locator,
-                on_clear=lambda: self._set_login_username(""),
-                on_send_keys=lambda value: self._set_login_username(value),
-            )
-        if locator == (By.NAME, "password"):
-            return MockWebElement(
-                locator=locator,
-                on_clear=lambda: self._set_login_password(""),
-                on_send_keys=lambda value: self._set_login_password(value),
-            )
-        submit_locators = {
-            (By.CSS_SELECTOR, "form button[type='submit'], form input[type='submit']"),
-            (By.CSS_SELECTOR, "form button[type='submit'], form input[type='submit'], button#loginButton"),
-        }
-        if locator in submit_locators:
-            return MockWebElement(locator=locator, on_click=self._submit_login)
-        error_locators = {
-            (By.CSS_SELECTOR, ".alert-error, .message-error, .error"),
-            (By.CSS_SELECTOR, ".message, .alert-error, .message-error, .error"),
-            (By.CSS_SELECTOR, ".alert.alert-danger, .alert.alert-error, .xnat-alert-error"),
-            (By.ID, "loginMessage"),
-            (By.ID, "login-error"),
-            (By.CSS_SELECTOR, "[role='alert'], [data-testid='login-error']"),
-        }
-        if locator in error_locators:
-            return MockWebElement(
-                locator=locator,
-                text_getter=lambda: self._ui.login_error,
-                is_displayed_getter=lambda: bool(self._ui.login_error),
-            )
-        return None
+    def _build_element_factories(self) -> Dict[Tuple[str, Locator], Callable[[Locator], MockWebElement]]:
+        """Map every ``(page, locator)`` pair to its element factory.
+
+        Built once per driver so element resolution is a single dict probe
+        instead of a page dispatch followed by a linear locator scan.
+        """
+
+        new_menu = (By.CSS_SELECTOR, "a[href='#new']")
+        table: Dict[Tuple[str, Locator], Callable[[Locator], MockWebElement]] = {}
+
+        def register(page: str, locators, factory: Callable[[Locator], MockWebElement]) -> None:
+            for locator in locators:
+                table[(page, locator)] = factory
+
+        register("login", _LOGIN_USERNAME_LOCATORS, self._make_login_username)
+        register("login", ((By.NAME, "password"),), self._make_login_password)
+        register("login", _LOGIN_SUBMIT_LOCATORS, self._make_login_submit)
+        register("login", _LOGIN_ERROR_LOCATORS, self._make_login_error)
+
+        register("dashboard", _DASHBOARD_WELCOME_LOCATORS, self._make_welcome_banner)
+        register(
+            "dashboard",
+            ((By.CSS_SELECTOR, "a[href*='projects'], a[href*='SelectProject']"),),
+            self._make_projects_nav,
+        )
+        register("dashboard", (new_menu,), self._make_static)
+        register("dashboard", ((By.CSS_SELECTOR, "a[href*='add_xnat_projectData']"),), self._make_project_create)
+
+        register("projects", _PROJECT_CREATE_LOCATORS, self._make_project_create)
+        register("projects", (new_menu,), self._make_static)
+        register("projects", _PROJECT_ID_LOCATORS, self._make_project_identifier)
+        register("projects", _PROJECT_NAME_LOCATORS, self._make_project_name)
+        register("projects", _PROJECT_DESCRIPTION_LOCATORS, self._make_project_description)
+        register("projects", _PROJECT_SUBMIT_LOCATORS, self._make_project_submit)
+
+        register("subjects", _SUBJECT_ADD_LOCATORS, self._make_subject_add)
+        register("subjects", (new_menu,), self._make_static)
+        register("subjects", _SUBJECT_LABEL_LOCATORS, self._make_subject_label)
+        register("subjects", _SUBJECT_SPECIES_LOCATORS, self._make_subject_species)
+        register("subjects", _ENTITY_SUBMIT_LOCATORS, self._make_subject_submit)
+
+        register("experiments", _EXPERIMENT_ADD_LOCATORS, self._make_experiment_add)
+        register("experiments", (new_menu,), self._make_static)
+        register("experiments", _EXPERIMENT_LABEL_LOCATORS, self._make_experiment_label)
+        register("experiments", _EXPERIMENT_MODALITY_LOCATORS, self._make_experiment_modality)
+        register("experiments", _ENTITY_SUBMIT_LOCATORS, self._make_experiment_submit)
+
+        return table
+
+    def _make_static(self, locator: Locator) -> MockWebElement:
+        return MockWebElement(locator=locator)
+
+    def _make_login_username(self, locator: Locator) -> MockWebElement:
+        return MockWebElement(
+            locator=locator,
+            on_clear=functools.partial(self._set_login_username, ""),
+            on_send_keys=self._set_login_username,
+        )
 
-    def _dashboard_element(self, locator: Locator) -> MockWebElement | None:
-        welcome_locators = {
-            (By.CSS_SELECTOR, "#page-content h1, .welcome-message"),
-            (By.CSS_SELECTOR, "#main_nav, body"),
-        }
-        if locator in welcome_locators:
-            return MockWebElement(
-                locator=locator,
-                text_getter=lambda: f"Welcome, {self._ui.logged_in_user}",
-            )
-        if locator == (By.CSS_SELECTOR, "a[href*='projects'], a[href*='SelectProject']"):
-            return MockWebElement(locator=locator, on_click=self._open_projects)
-        if locator == (By.CSS_SELECTOR, "a[href='#new']"):
-            return MockWebElement(locator=locator)
-        if locator == (By.CSS_SELECTOR, "a[href*='add_xnat_projectData']"):
-            return MockWebElement(locator=locator, on_click=self._show_project_form)
-        return None
+    def _make_login_password(self, locator: Locator) -> MockWebElement:
+        return MockWebElement(
+            locator=locator,
+            on_clear=functools.partial(self._set_login_password, ""),
+            on_send_keys=self._set_login_password,
+        )
 
-    def _projects_element(self, locator: Locator) -> MockWebElement | None:
-        create_locators = {
-            (By.CSS_SELECTOR, "a#create-project, a[href*='CreateProject']"),
-            (By.CSS_SELECTOR, "a[href*='add_xnat_projectData']"),
-        }
-        if locator in create_locators:
-            return MockWebElement(locator=locator, on_click=self._show_project_form)
-        if locator == (By.CSS_SELECTOR, "a[href='#new']"):
-            return MockWebElement(locator=locator)
-        identifier_locators = {
-            (By.NAME, "ID"),
-            (By.NAME, "xnat:projectData/ID"),
-        }
-        if locator in identifier_locators:
-            return MockWebElement(
-                locator=locator,
-                on_clear=lambda: self._set_project_identifier(""),
-                on_send_keys=lambda value: self._set_project_identifier(value),
-                is_displayed_getter=lambda: self._ui.project_form_visible,
-            )
-        name_locators = {
-            (By.NAME, "name"),
-            (By.NAME, "xnat:projectData/name"),
-        }
-        if locator in name_locators:
-            return MockWebElement(
-                locator=locator,
-                on_clear=lambda: self._set_project_name(""),
-                on_send_keys=lambda value: self._set_project_name(value),
-                is_displayed_getter=lambda: self._ui.project_form_visible,
-            )
-        description_locators = {
-            (By.NAME, "description"),
-            (By.NAME, "xnat:projectData/description"),
-        }
-        if locator in description_locators:
-            return MockWebElement(
-                locator=locator,
-                on_clear=lambda: self._set_project_description(""),
-                on_send_keys=lambda value: self._set_project_description(value),
-                is_displayed_getter=lambda: self._ui.project_form_visible,
-            )
-        submit_locators = {
-            (By.CSS_SELECTOR, "form button[type='submit'], form input[type='submit']"),
-            (By.CSS_SELECTOR, "input[name='eventSubmit_doPerform'], input[value*='Create Project'], button[type='submit'], input[type='submit']"),
-        }
-        if locator in submit_locators:
-            return MockWebElement(
-                locator=locator,
-                on_click=self._submit_project,
-                is_displayed_getter=lambda: self._ui.project_form_visible,
-            )
-        return None
+    def _make_login_submit(self, locator: Locator) -> MockWebElement:
+        return MockWebElement(locator=locator, on_click=self._submit_login)
 
-    def _subjects_element(self, locator: Locator) -> MockWebElement | None:
-        add_subject_locators = {
-            (By.CSS_SELECTOR, "a[href*='AddSubject'], button#create-subject"),
-            (By.CSS_SELECTOR, "a[href*='xdataction/edit/search_element/xnat%3AsubjectData']"),
-        }
-        if locator in add_subject_locators:
-            return MockWebElement(locator=locator, on_click=self._show_subject_form)
-        if locator == (By.CSS_SELECTOR, "a[href='#new']"):
-            return MockWebElement(locator=locator)
-        label_locators = {
-            (By.NAME, "label"),
-            (By.NAME, "xnat:subjectData/label"),
-        }
-        if locator in label_locators:
-            return MockWebElement(
-                locator=locator,
-                on_clear=lambda: self._set_subject_label(""),
-                on_send_keys=lambda value: self._set_subject_label(value),
-                is_displayed_getter=lambda: self._ui.subject_form_visible,
-            )
-        species_locators = {
-            (By.NAME, "species"),
-            (By.NAME, "xnat:subjectData/demographics[@xsi:type=xnat:demographicData]/species"),
-        }
-        if locator in species_locators:
-            return MockWebElement(
-                locator=locator,
-                on_clear=lambda: self._set_subject_species(""),
-                on_send_keys=lambda value: self._set_subject_species(value),
-                is_displayed_getter=lambda: self._ui.subject_form_visible,
-            )
-        submit_locators = {
-            (By.CSS_SELECTOR, "form button[type='submit'], form input[type='submit']"),
-            (By.CSS_SELECTOR, "input[name='eventSubmit_doInsert'], input[value*='Submit'], button[type='submit'], input[type='submit']"),
-        }
-        if locator in submit_locators:
-            return MockWebElement(
-                locator=locator,
-                on_click=self._submit_subject,
-                is_displayed_getter=lambda: self._ui.subject_form_visible,
-            )
-        return None
+    def _make_login_error(self, locator: Locator) -> MockWebElement:
+        return MockWebElement(
+            locator=locator,
+            text_getter=self._login_error_text,
+            is_displayed_getter=self._login_error_visible,
+        )
 
-    def _experiments_element(self, locator: Locator) -> MockWebElement | None:
-        add_experiment_locators = {
-            (By.CSS_SELECTOR, "a[href*='AddExperiment'], button#create-session"),
-            (By.CSS_SELECTOR, "a[href*='add_experiment'], a[href*='xdataction/edit'][href*='experiment']"),
-        }
-        if locator in add_experiment_locators:
-            return MockWebElement(locator=locator, on_click=self._show_experiment_form)
-        if locator == (By.CSS_SELECTOR, "a[href='#new']"):
-            return MockWebElement(locator=locator)
-        label_locators = {
-            (By.NAME, "label"),
-            (By.NAME, "xnat:mrSessionData/label"),
-        }
-        if locator in label_locators:
-            return MockWebElement(
-                locator=locator,
-                on_clear=lambda: self._set_experiment_label(""),
-                on_send_keys=lambda value: self._set_experiment_label(value),
-                is_displayed_getter=lambda: self._ui.experiment_form_visible,
-            )
-        modality_locators = {
-            (By.NAME, "modality"),
-            (By.NAME, "xnat:mrSessionData/modality"),
-        }
-        if locator in modality_locators:
-            return MockWebElement(
-                locator=locator,
-                on_clear=lambda: self._set_experiment_modality(""),
-                on_send_keys=lambda value: self._set_experiment_modality(value),
-                is_displayed_getter=lambda: self._ui.experiment_form_visible,
-            )
-        submit_locators = {
-            (By.CSS_SELECTOR, "form button[type='submit'], form input[type='submit']"),
-            (By.CSS_SELECTOR, "input[name='eventSubmit_doInsert'], input[value*='Submit'], button[type='submit'], input[type='submit']"),
-        }
-        if locator in submit_locators:
-            return MockWebElement(
-                locator=locator,
-                on_click=self._submit_experiment,
-                is_displayed_getter=lambda: self._ui.experiment_form_visible,
-            )
-        return None
+    def _make_welcome_banner(self, locator: Locator) -> MockWebElement:
+        return MockWebElement(
+            locator=locator,
+            text_getter=self._welcome_text,
+        )
+
+    def _make_projects_nav(self, locator: Locator) -> MockWebElement:
+        return MockWebElement(locator=locator, on_click=self._open_projects)
+
+    def _make_project_create(self, locator: Locator) -> MockWebElement:
+        return MockWebElement(locator=locator, on_click=self._show_project_form)
+
+    def _make_project_identifier(self, locator: Locator) -> MockWebElement:
+        return MockWebElement(
+            locator=locator,
+            on_clear=functools.partial(self._set_project_identifier, ""),
+            on_send_keys=self._set_project_identifier,
+            is_displayed_getter=self._project_form_is_visible,
+        )
+
+    def _make_project_name(self, locator: Locator) -> MockWebElement:
+        return MockWebElement(
+            locator=locator,
+            on_clear=functools.partial(self._set_project_name, ""),
+            on_send_keys=self._set_project_name,
+            is_displayed_getter=self._project_form_is_visible,
+        )
+
+    def _make_project_description(self, locator: Locator) -> MockWebElement:
+        return MockWebElement(
+            locator=locator,
+            on_clear=functools.partial(self._set_project_description, ""),
+            on_send_keys=self._set_project_description,
+            is_displayed_getter=self._project_form_is_visible,
+        )
+
+    def _make_project_submit(self, locator: Locator) -> MockWebElement:
+        return MockWebElement(
+            locator=locator,
+            on_click=self._submit_project,
+            is_displayed_getter=self._project_form_is_visible,
+        )
+
+    def _make_subject_add(self, locator: Locator) -> MockWebElement:
+        return MockWebElement(locator=locator, on_click=self._show_subject_form)
+
+    def _make_subject_label(self, locator: Locator) -> MockWebElement:
+        return MockWebElement(
+            locator=locator,
+            on_clear=functools.partial(self._set_subject_label, ""),
+            on_send_keys=self._set_subject_label,
+            is_displayed_getter=self._subject_form_is_visible,
+        )
+
+    def _make_subject_species(self, locator: Locator) -> MockWebElement:
+        return MockWebElement(
+            locator=locator,
+            on_clear=functools.partial(self._set_subject_species, ""),
+            on_send_keys=self._set_subject_species,
+            is_displayed_getter=self._subject_form_is_visible,
+        )
+
+    def _make_subject_submit(self, locator: Locator) -> MockWebElement:
+        return MockWebElement(
+            locator=locator,
+            on_click=self._submit_subject,
+            is_displayed_getter=self._subject_form_is_visible,
+        )
+
+    def _make_experiment_add(self, locator: Locator) -> MockWebElement:
+        return MockWebElement(locator=locator, on_click=self._show_experiment_form)
+
+    def _make_experiment_label(self, locator: Locator) -> MockWebElement:
+        return MockWebElement(
+            locator=locator,
+            on_clear=functools.partial(self._set_experiment_label, ""),
+            on_send_keys=self._set_experiment_label,
+            is_displayed_getter=self._experiment_form_is_visible,
+        )
+
+    def _make_experiment_modality(self, locator: Locator) -> MockWebElement:
+        return MockWebElement(
+            locator=locator,
+            on_clear=functools.partial(self._set_experiment_modality, ""),
+            on_send_keys=self._set_experiment_modality,
+            is_displayed_getter=self._experiment_form_is_visible,
+        )
+
+    def _make_experiment_submit(self, locator: Locator) -> MockWebElement:
+        return MockWebElement(
+            locator=locator,
+            on_click=self._submit_experiment,
+            is_displayed_getter=self._experiment_form_is_visible,
+        )
+
+    # ------------------------------------------------------------------
+    # Bound-method callbacks shared by the factories above; plain methods so
+    # building a form element allocates no lambda/closure objects.
+    # ------------------------------------------------------------------
+    def _project_form_is_visible(self) -> bool:
+        return self._ui.project_form_visible
+
+    def _subject_form_is_visible(self) -> bool:
+        return self._ui.subject_form_visible
+
+    def _experiment_form_is_visible(self) -> bool:
+        return self._ui.experiment_form_visible
+
+    def _user_menu_is_open(self) -> bool:
+        return self._ui.user_menu_open
+
+    def _login_error_text(self) -> str:
+        return self._ui.login_error
+
+    def _login_error_visible(self) -> bool:
+        return bool(self._ui.login_error)
+
+    def _welcome_text(self) -> str:
+        return f"Welcome, {self._ui.logged_in_user}"
+
+    # Factories whose elements carry no per-interaction state and can be
+    # reused across lookups.
+    _CACHEABLE_FACTORIES = frozenset({_make_static, _make_welcome_banner, _make_projects_nav})
 
     # ------------------------------------------------------------------
     # State mutation helpers
@@ -585,17 +844,17 @@ class MockWebDriver:
         self._ui.login_password = value
 
     def _submit_login(self) -> None:
-        username = self._ui.login_username
-        password = self._ui.login_password
+        ui = self._ui
+        username = ui.login_username
         stored_password = self._users.get(username)
-        if stored_password and stored_password == password:
-            self._ui.logged_in_user = username
-            self._ui.login_error = ""
-            self._ui.current_page = "dashboard"
-            self._ui.current_url = f"{self.base_url}/app/template/XDATScreen_select_project.vm"
+        if stored_password and stored_password == ui.login_password:
+            ui.logged_in_user = username
+            ui.login_error = ""
+            ui.current_page = "dashboard"
+            ui.current_url = f"{self.base_url}/app/template/XDATScreen_select_project.vm"
             return
-        self._ui.login_error = "Invalid username or password"
-        self._ui.logged_in_user = None
+        ui.login_error = "Invalid username or password"
+        ui.logged_in_user = None
 
     def _open_projects(self) -> None:
         self._ui.current_page = "projects"
@@ -606,6 +865,8 @@ class MockWebDriver:
 
     def _logout(self) -> None:
         self._ui = _UiState()
+        self._element_cache.clear()
+        self._shared_element_cache.clear()
 
     def _show_project_form(self) -> None:
         self._ui.project_form_visible = True
@@ -632,10 +893,10 @@ class MockWebDriver:
             aliases=(),
             keywords=(),
         )
-        # prevent duplicate identifiers from creating multiple entries
-        self._projects = [p for p in self._projects if p.identifier != project.identifier]
-        self._projects.append(project)
-        self._subjects.setdefault(project.identifier, [])
+        # ordered dict assignment keeps duplicate identifiers as one entry
+        self._projects[project.identifier] = project
+        self._subjects.setdefault(project.identifier, {})
+        self._projects_gen += 1
         self._ui.project_form_visible = False
 
     def _show_subject_form(self) -> None:
@@ -654,10 +915,8 @@ class MockWebDriver:
         if not project_identifier or not self._ui.subject_label:
             return
         subject = _Subject(label=self._ui.subject_label, species=self._ui.subject_species or None)
-        subjects = self._subjects.setdefault(project_identifier, [])
-        subjects = [s for s in subjects if s.label != subject.label]
-        subjects.append(subject)
-        self._subjects[project_identifier] = subjects
+        self._subjects.setdefault(project_identifier, {})[subject.label] = subject
+        self._subjects_gen[project_identifier] = self._subjects_gen.get(project_identifier, 0) + 1
         self._ui.subject_form_visible = False
 
     def _show_experiment_form(self) -> None:
@@ -681,10 +940,8 @@ class MockWebDriver:
             modality=self._ui.experiment_modality or None,
         )
         key = (project_identifier, subject_label)
-        experiments = self._experiments.setdefault(key, [])
-        experiments = [exp for exp in experiments if exp.label != experiment.label]
-        experiments.append(experiment)
-        self._experiments[key] = experiments
+        self._experiments.setdefault(key, {})[experiment.label] = experiment
+        self._experiments_gen[key] = self._experiments_gen.get(key, 0) + 1
         self._ui.experiment_form_visible = False
 
     # ------------------------------------------------------------------
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import bisect
 from dataclasses import dataclass
 from typing import Dict, Iterable, List, Sequence, Tuple, Type
 
@@ -10,56 +11,96 @@ class XnatPageComponent:
     """Base class for page components bound to XNAT versions."""
 
     handled_versions: Sequence[Type["XnatVersion"]] = ()
+    _registry_root: Type["XnatPageComponent"]
+
+    def __init_subclass__(cls, **kwargs) -> None:
+        super().__init_subclass__(**kwargs)
+        # Each component's root is fixed at class-creation time; resolving it
+        # here keeps the registry hot path free of MRO walks.
+        cls._registry_root = next(
+            (
+                base
+                for base in reversed(cls.__mro__)
+                if base is not XnatPageComponent
+                and base is not object
+                and issubclass(base, XnatPageComponent)
+            ),
+            cls,
+        )
 
     @classmethod
     def get_handled_versions(cls) -> Tuple[Type["XnatVersion"], ...]:
-        return tuple(cls.handled_versions)
+        # ``handled_versions`` is a class-body constant, so the tuple is built
+        # once per class and reread from ``__dict__`` afterwards.
+        cached = cls.__dict__.get("_handled_versions_tuple")
+        if cached is None:
+            cached = tuple(cls.handled_versions)
+            cls._handled_versions_tuple = cached
+        return cached
 
 
 class XnatVersion:
     """Marker base class for XNAT versions."""
 
 
+def _candidate_order(component: Type["XnatPageComponent"]) -> Tuple[int, int]:
+    """Sort key keeping the most derived, most specific candidates first."""
+
+    return (-component._registry_depth, -len(component._handled_versions_set))
+
+
 class PageObjectRegistry:
     """Registry mapping base components to version specific subclasses."""
 
     _registry: Dict[Type[XnatPageComponent], List[Type[XnatPageComponent]]] = {}
+    # Resolved (base component, version) pairs; the registry only changes via
+    # ``register``/``clear``, which invalidate the cache wholesale.
+    _resolution_cache: Dict[
+        Tuple[Type[XnatPageComponent], Type["XnatVersion"]], Type[XnatPageComponent]
+    ] = {}
 
     @classmethod
     def register(cls, component: Type[XnatPageComponent]) -> Type[XnatPageComponent]:
         root = cls._root_component(component)
-        cls._registry.setdefault(root, [])
-        if component not in cls._registry[root]:
-            cls._registry[root].append(component)
+        # Depth and the version set are fixed per class; compute them here so
+        # resolution never walks the MRO or scans version tuples.
+        component._registry_depth = cls._depth(component, root)
+        component._handled_versions_set = frozenset(component.get_handled_versions())
+        bucket = cls._registry.setdefault(root, [])
+        if component not in bucket:
+            # Maintain the resolution order at insert time so lookups never
+            # re-sort the candidate list.
+            bisect.insort(bucket, component, key=_candidate_order)
+            cls._resolution_cache.clear()
         return component
 
     @classmethod
     def clear(cls) -> None:
         cls._registry.clear()
+        cls._resolution_cache.clear()
 
     @classmethod
     def get_page_object(
         cls, base_component: Type[XnatPageComponent], version: Type["XnatVersion"]
     ) -> Type[XnatPageComponent]:
-        root = cls._root_component(base_component)
-        candidates = cls._registry.get(root, [])
-        # Prefer most derived classes first
-        ordered = sorted(
-            candidates,
-            key=lambda component: (-cls._depth(component, root), -len(component.get_handled_versions())),
-        )
-        for component in ordered:
-            if version in component.get_handled_versions():
-                return component
-        return base_component
+        cache_key = (base_component, version)
+        cached = cls._resolution_cache.get(cache_key)
+        if cached is not None:
+            return cached
+        root = base_component._registry_root
+        # Candidates are kept sorted most-derived-first by ``register``.
+        candidates = cls._registry.get(root, ())
+        resolved = base_component
+        for component in candidates:
+            if version in component._handled_versions_set:
+                resolved = component
+                break
+        cls._resolution_cache[cache_key] = resolved
+        return resolved
 
     @staticmethod
     def _root_component(component: Type[XnatPageComponent]) -> Type[XnatPageComponent]:
-        root = component
-        for base in component.mro():
-            if issubclass(base, XnatPageComponent) and base is not XnatPageComponent:
-                root = base
-        return root
+        return component._registry_root
 
     @staticmethod
     def _depth(component: Type[XnatPageComponent], root: Type[XnatPageComponent]) -> int:
@@ -105,3 +146,5 @@ class Xnat_1_7_2(XnatVersion):
 class Xnat_1_6dev(XnatVersion):
     pass
 
+
+XnatPageComponent._registry_root = XnatPageComponent
@@ -6,18 +6,87 @@ in the test-suite.
 """
 from __future__ import annotations
 
+import contextlib
+import functools
 import logging
-from typing import Callable, Iterable, Optional, Tuple
-
-from selenium.common.exceptions import TimeoutException
+import sys
+from typing import Callable, Iterable, Iterator, NamedTuple, Optional
+
+from selenium.common.exceptions import (
+    InvalidElementStateException,
+    NoSuchElementException,
+    TimeoutException,
+)
+from selenium.webdriver.common.by import By
+from selenium.webdriver.common.keys import Keys
 from selenium.webdriver.remote.webdriver import WebDriver
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.webdriver.support.ui import WebDriverWait
 
-Locator = Tuple[str, str]
+class Locator(NamedTuple):
+    """A ``(by, value)`` pair identifying elements on a page.
+
+    Behaves exactly like the plain two-tuples historically used for
+    locators (``find_element(*locator)`` still works), while giving the
+    JS-batching helpers named ``.value`` access to the raw selector.  No
+    wire-format payload is stored: the Selenium client composes the JSON
+    command body itself, so precomputing it here would buy nothing.
+    """
+
+    by: str
+    value: str
+
 
 LOGGER = logging.getLogger(__name__)
 
+# Locators shared by several page objects.  The selector strings are interned
+# so every page class references a single string object instead of per-module
+# copies, and comparisons against them are pointer-equal.
+NEW_MENU = Locator(By.CSS_SELECTOR, sys.intern("a[href='#new']"))
+INSERT_SUBMIT_BUTTON = Locator(
+    By.CSS_SELECTOR,
+    sys.intern(
+        "input[name='eventSubmit_doInsert'], input[value*='Submit'], "
+        "button[type='submit'], input[type='submit']"
+    ),
+)
+DATA_TABLE_ROWS = Locator(
+    By.CSS_SELECTOR,
+    sys.intern("table.xnat-table tbody tr[data-id], table tbody tr"),
+)
+
+
+# Expected-condition factories return stateless callables, and the page
+# objects wait on a small fixed set of class-level locator tuples, so the
+# built conditions are cached and reused instead of rebuilt per wait.
+@functools.lru_cache(maxsize=None)
+def _ec_visible(locator: Locator):
+    return EC.visibility_of_element_located(locator)
+
+
+@functools.lru_cache(maxsize=None)
+def _ec_clickable(locator: Locator):
+    return EC.element_to_be_clickable(locator)
+
+
+@functools.lru_cache(maxsize=None)
+def _ec_present(locator: Locator):
+    return EC.presence_of_element_located(locator)
+
+
+# Substring-matches table rows inside the browser, returning on the first hit
+# so no row text is marshalled back over the wire.
+_ROW_MATCH_SCRIPT = """
+const rows = document.querySelectorAll(arguments[0]);
+const needle = arguments[1];
+const extra = arguments[2];
+for (const row of rows) {
+  const text = row.innerText || '';
+  if (text.includes(needle) && (!extra || text.includes(extra))) return true;
+}
+return false;
+"""
+
 
 class BasePage:
     """Base implementation for all XNAT page objects.
@@ -36,6 +105,18 @@ class BasePage:
         self.driver = driver
         self.base_url = base_url.rstrip("/")
         self.timeout = timeout
+        # ``WebDriverWait`` instances are stateless between ``until`` calls,
+        # so one per timeout can serve every wait on this page object.
+        self._wait_cache: dict[int, WebDriverWait] = {}
+
+    def _wait(self, timeout: Optional[int] = None) -> WebDriverWait:
+        """Return a cached ``WebDriverWait`` for ``timeout`` (default page timeout)."""
+        resolved = timeout or self.timeout
+        wait = self._wait_cache.get(resolved)
+        if wait is None:
+            wait = WebDriverWait(self.driver, resolved)
+            self._wait_cache[resolved] = wait
+        return wait
 
     # ------------------------------------------------------------------
     # Navigation helpers
@@ -52,19 +133,17 @@ class BasePage:
     def wait_for_visibility(self, locator: Locator, timeout: Optional[int] = None):
         """Wait until an element located by ``locator`` is visible."""
         LOGGER.debug("Waiting for visibility of %s", locator)
-        wait = WebDriverWait(self.driver, timeout or self.timeout)
-        return wait.until(EC.visibility_of_element_located(locator))
+        return self._wait(timeout).until(_ec_visible(locator))
 
     def wait_for_clickable(self, locator: Locator, timeout: Optional[int] = None):
         """Wait until an element located by ``locator`` can be clicked."""
         LOGGER.debug("Waiting for clickability of %s", locator)
-        wait = WebDriverWait(self.driver, timeout or self.timeout)
-        return wait.until(EC.element_to_be_clickable(locator))
+        return self._wait(timeout).until(_ec_clickable(locator))
 
     def wait_until(self, condition: Callable[[WebDriver], bool], *, timeout: Optional[int] = None, message: str = "") -> None:
         """Wait until a custom ``condition`` returns ``True``."""
         LOGGER.debug("Waiting until condition %s", message or condition)
-        wait = WebDriverWait(self.driver, timeout or self.timeout)
+        wait = self._wait(timeout)
         try:
             wait.until(condition, message)
         except TimeoutException as exc:  # pragma: no cover - defensive logging
@@ -80,9 +159,6 @@ class BasePage:
         element.click()
 
     def fill(self, locator: Locator, value: str, *, clear: bool = True) -> None:
-        from selenium.common.exceptions import InvalidElementStateException
-        from selenium.webdriver.common.keys import Keys
-
         element = self.wait_for_visibility(locator)
         LOGGER.debug("Typing in element %s", locator)
         if clear:
@@ -108,16 +184,53 @@ class BasePage:
         LOGGER.debug("Finding elements %s", locator)
         return self.driver.find_elements(*locator)
 
+    @contextlib.contextmanager
+    def _no_implicit_wait(self) -> Iterator[None]:
+        """Temporarily zero the implicit wait for bulk ``find_elements`` calls.
+
+        With an implicit wait active, enumerating an empty table stalls for
+        the full implicit timeout before returning ``[]``; bulk reads want an
+        immediate answer.  Drivers without a ``timeouts`` API (the mock) are
+        passed through untouched.
+        """
+        timeouts = getattr(self.driver, "timeouts", None)
+        if timeouts is None:
+            yield
+            return
+        previous = timeouts.implicit_wait
+        self.driver.implicitly_wait(0)
+        try:
+            yield
+        finally:
+            self.driver.implicitly_wait(previous)
+
+    def any_row_matches(self, locator: Locator, needle: str, extra: Optional[str] = None) -> bool:
+        """Return whether any element under ``locator`` contains the given text.
+
+        The predicate runs in the browser via a single ``execute_script``
+        call, so large tables cost one round-trip and no text payload.
+        """
+        return bool(self.driver.execute_script(_ROW_MATCH_SCRIPT, locator[1], needle, extra))
+
     def any_visible(self, locators: Iterable[Locator], timeout: Optional[int] = None) -> Locator:
         """Wait until any of the provided locators is visible.
 
-        The locator that first becomes visible is returned.
+        The locator that first becomes visible is returned.  All locators are
+        checked on every poll cycle, so the total wait is bounded by
+        ``timeout`` rather than ``timeout`` per locator.
         """
-        wait = WebDriverWait(self.driver, timeout or self.timeout)
-        for locator in locators:
-            try:
-                wait.until(EC.visibility_of_element_located(locator))
-                return locator
-            except TimeoutException:
-                continue
-        raise TimeoutException("None of the provided locators became visible")
+        locators = tuple(locators)
+
+        def _first_visible(driver: WebDriver):
+            for locator in locators:
+                try:
+                    if driver.find_element(*locator).is_displayed():
+                        return locator
+                except NoSuchElementException:
+                    continue
+            return False
+
+        try:
+            return self._wait(timeout).until(_first_visible)
+        except TimeoutException:
+            raise TimeoutException("None of the provided locators became visible") from None
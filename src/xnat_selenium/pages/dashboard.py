@@ -2,10 +2,11 @@
 from __future__ import annotations
 
 from selenium.webdriver.common.by import By
+from selenium.webdriver.support.ui import WebDriverWait
 
 from xnat_selenium.mock_driver import is_mock_base_url
 
-from .base import BasePage
+from .base import BasePage, _ec_present, _ec_visible
 
 
 class DashboardPage(BasePage):
@@ -17,10 +18,17 @@ class DashboardPage(BasePage):
     _browse_menu = (By.CSS_SELECTOR, "a[href='#browse'], li.more a:contains('Browse')")
     _all_projects_link = (By.CSS_SELECTOR, "#browse-projects-menu-item, a.nolink:contains('All Projects')")
     _logout_link = (By.ID, "logout_user")
+    _all_projects_menu_item = (By.ID, "browse-projects-menu-item")
 
     def wait_until_loaded(self) -> None:
-        # Wait for main navigation to be visible (confirms page loaded)
-        self.wait_for_visibility(self._welcome_banner)
+        # Key "loaded" on the logout link rather than the old ``#main_nav,
+        # body`` banner: ``body`` matches the login page too, so the banner
+        # condition could pass before authentication actually landed.  This
+        # runs once per session, so the tighter 0.1 s poll is cheap and
+        # returns up to 0.4 s sooner than the default 0.5 s interval.
+        WebDriverWait(self.driver, self.timeout, poll_frequency=0.1).until(
+            _ec_visible(self._logout_link)
+        )
 
     def go_to_projects(self) -> None:
         # In modern XNAT, projects are shown on the home page in dropdown menus.
@@ -29,10 +37,7 @@ class DashboardPage(BasePage):
         if is_mock_base_url(self.base_url):
             self.visit("/app/template/XDATScreen_manage_projects.vm")
             return
-        from selenium.webdriver.support import expected_conditions as EC
-        from selenium.webdriver.support.ui import WebDriverWait
-        wait = WebDriverWait(self.driver, self.timeout)
-        wait.until(EC.presence_of_element_located((By.ID, "browse-projects-menu-item")))
+        self._wait().until(_ec_present(self._all_projects_menu_item))
 
     def welcome_message(self) -> str:
         """Return the welcome banner text displayed on the dashboard."""
@@ -40,3 +45,7 @@ class DashboardPage(BasePage):
 
     def logout(self) -> None:
         self.click(self._logout_link)
+        if not is_mock_base_url(self.base_url):
+            # Drop the session cookie so callers can treat its presence as
+            # proof of a live session; XNAT does not reliably clear it.
+            self.driver.delete_cookie("JSESSIONID")
@@ -6,7 +6,7 @@ from typing import Optional
 
 from selenium.webdriver.common.by import By
 
-from .base import BasePage
+from .base import DATA_TABLE_ROWS, INSERT_SUBMIT_BUTTON, NEW_MENU, BasePage, _ec_present
 from xnat_selenium.mock_driver import is_mock_base_url
 
 
@@ -21,12 +21,12 @@ class Experiment:
 class ExperimentsPage(BasePage):
     """Interact with experiments for a given subject."""
 
-    _new_menu = (By.CSS_SELECTOR, "a[href='#new']")
+    _new_menu = NEW_MENU
     _add_experiment_link = (By.CSS_SELECTOR, "a[href*='add_experiment'], a[href*='xdataction/edit'][href*='experiment']")
     _experiment_label = (By.NAME, "xnat:mrSessionData/label")  # Most common experiment type
     _experiment_modality = (By.NAME, "xnat:mrSessionData/modality")
-    _save_button = (By.CSS_SELECTOR, "input[name='eventSubmit_doInsert'], input[value*='Submit'], button[type='submit'], input[type='submit']")
-    _experiment_table_rows = (By.CSS_SELECTOR, "table.xnat-table tbody tr[data-id], table tbody tr")
+    _save_button = INSERT_SUBMIT_BUTTON
+    _experiment_table_rows = DATA_TABLE_ROWS
 
     def open(self, project_identifier: str, subject_label: str) -> None:
         if is_mock_base_url(self.base_url):
@@ -35,10 +35,7 @@ class ExperimentsPage(BasePage):
             )
         else:
             self.visit(f"/data/projects/{project_identifier}/subjects/{subject_label}")
-            from selenium.webdriver.support import expected_conditions as EC
-            from selenium.webdriver.support.ui import WebDriverWait
-            wait = WebDriverWait(self.driver, self.timeout)
-            wait.until(EC.presence_of_element_located(self._new_menu))
+            self._wait().until(_ec_present(self._new_menu))
 
     def start_experiment_creation(self) -> None:
         # In modern XNAT, experiment creation is under the "New" menu
@@ -63,17 +60,44 @@ class ExperimentsPage(BasePage):
         self.submit_experiment_form()
 
     def experiment_exists(self, experiment: Experiment) -> bool:
+        label = experiment.label
+        modality = experiment.modality
+        if is_mock_base_url(self.base_url):
+            # Walk the rows lazily and stop at the first hit instead of
+            # extracting text for every row up front.
+            for row in self.elements(self._experiment_table_rows):
+                text = row.text
+                if label in text and (not modality or modality in text):
+                    return True
+            return False
         rows = self.experiment_rows()
-        if experiment.modality:
-            return any(experiment.label in row and experiment.modality in row for row in rows)
-        return any(experiment.label in row for row in rows)
+        if modality:
+            return any(label in row and modality in row for row in rows)
+        return any(label in row for row in rows)
 
     def experiment_rows(self) -> list[str]:
-        """Return the raw text contents of the experiment table rows."""
+        """Return the raw text contents of the experiment table rows.
+
+        Against a real browser every ``row.text`` read is its own WebDriver
+        round-trip, so the texts are collected in a single ``execute_script``
+        call; the in-process mock keeps the direct element walk.
+        """
 
-        return [row.text for row in self.elements(self._experiment_table_rows)]
+        if is_mock_base_url(self.base_url):
+            with self._no_implicit_wait():
+                return [row.text for row in self.elements(self._experiment_table_rows)]
+        return self.driver.execute_script(
+            "return Array.from(document.querySelectorAll(arguments[0])).map(e => e.innerText);",
+            self._experiment_table_rows[1],
+        )
 
     def experiment_count(self) -> int:
         """Return the number of experiments currently displayed."""
 
-        return len(self.elements(self._experiment_table_rows))
+        if is_mock_base_url(self.base_url):
+            with self._no_implicit_wait():
+                return len(self.elements(self._experiment_table_rows))
+        return self.driver.execute_script(
+            "return document.querySelectorAll(arguments[0]).length;",
+            self._experiment_table_rows[1],
+        )
@@ -4,8 +4,28 @@ from __future__ import annotations
 from selenium.common.exceptions import NoSuchElementException, StaleElementReferenceException, TimeoutException
 from selenium.webdriver.common.by import By
 
+from xnat_selenium.mock_driver import is_mock_base_url
+
 from .base import BasePage
 
+# Runs every banner lookup plus the HTML5 validation fallback in the browser,
+# collapsing up to a dozen WebDriver round-trips into one script call.
+_ERROR_MESSAGE_SCRIPT = """
+const sels = arguments[0];
+for (const s of sels) {
+  const e = document.querySelector(s);
+  if (e) {
+    const t = (e.innerText || e.textContent || '').trim();
+    if (t) return t;
+  }
+}
+for (const n of ['login', 'username', 'password']) {
+  const f = document.getElementsByName(n)[0];
+  if (f && f.validationMessage) return f.validationMessage;
+}
+return '';
+"""
+
 
 class LoginPage(BasePage):
     """Interact with the XNAT login page."""
@@ -23,6 +43,14 @@ class LoginPage(BasePage):
         (By.ID, "login-error"),
         (By.CSS_SELECTOR, "[role='alert'], [data-testid='login-error']"),
     )
+    # CSS equivalents of the banner locators, used by the scripted fast path.
+    _error_banner_selectors = (
+        ".message, .alert-error, .message-error, .error",
+        ".alert.alert-danger, .alert.alert-error, .xnat-alert-error",
+        "#loginMessage",
+        "#login-error",
+        "[role='alert'], [data-testid='login-error']",
+    )
 
     def open(self) -> "LoginPage":
         self.visit(self.path)
@@ -55,6 +83,21 @@ class LoginPage(BasePage):
     def error_message(self) -> str:
         """Return any validation or authentication message shown on login failure."""
 
+        if not is_mock_base_url(self.base_url):
+            # One round-trip per poll covers every banner and validation
+            # lookup; the bounded wait preserves the baseline behaviour for
+            # banners that page JS renders asynchronously after submit.
+            selectors = list(self._error_banner_selectors)
+
+            def _probe(driver) -> str | bool:
+                message = driver.execute_script(_ERROR_MESSAGE_SCRIPT, selectors)
+                return (message or "").strip() or False
+
+            try:
+                return self._wait(5).until(_probe)
+            except TimeoutException:
+                return ""
+
         try:
             locator = self.any_visible(self._error_banner_locators, timeout=5)
             message = self._extract_banner_text(locator)
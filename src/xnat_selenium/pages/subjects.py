@@ -6,11 +6,11 @@ from typing import Optional
 
 from selenium.webdriver.common.by import By
 
-from .base import BasePage
+from .base import DATA_TABLE_ROWS, INSERT_SUBMIT_BUTTON, NEW_MENU, BasePage, _ec_present
 from xnat_selenium.mock_driver import is_mock_base_url
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class Subject:
     """Representation of an XNAT subject used in tests."""
 
@@ -21,22 +21,19 @@ class Subject:
 class SubjectsPage(BasePage):
     """Interact with the subject list within a project."""
 
-    _new_menu = (By.CSS_SELECTOR, "a[href='#new']")
+    _new_menu = NEW_MENU
     _add_subject_link = (By.CSS_SELECTOR, "a[href*='xdataction/edit/search_element/xnat%3AsubjectData']")
     _subject_label = (By.NAME, "xnat:subjectData/label")
     _subject_species = (By.NAME, "xnat:subjectData/demographics[@xsi:type=xnat:demographicData]/species")
-    _save_subject = (By.CSS_SELECTOR, "input[name='eventSubmit_doInsert'], input[value*='Submit'], button[type='submit'], input[type='submit']")
-    _subject_table_rows = (By.CSS_SELECTOR, "table.xnat-table tbody tr[data-id], table tbody tr")
+    _save_subject = INSERT_SUBMIT_BUTTON
+    _subject_table_rows = DATA_TABLE_ROWS
 
     def open(self, project_identifier: str) -> None:
         if is_mock_base_url(self.base_url):
             self.visit(f"/app/action/DisplayItemAction/search_element/subject/{project_identifier}")
         else:
             self.visit(f"/data/projects/{project_identifier}")
-            from selenium.webdriver.support import expected_conditions as EC
-            from selenium.webdriver.support.ui import WebDriverWait
-            wait = WebDriverWait(self.driver, self.timeout)
-            wait.until(EC.presence_of_element_located(self._new_menu))
+            self._wait().until(_ec_present(self._new_menu))
 
     def start_subject_creation(self) -> None:
         # In modern XNAT, subject creation is under the "New" menu
@@ -59,17 +56,42 @@ class SubjectsPage(BasePage):
         self.submit_subject_form()
 
     def subject_exists(self, subject: Subject) -> bool:
-        rows = self.subject_rows()
-        if subject.species:
-            return any(subject.label in row and subject.species in row for row in rows)
-        return any(subject.label in row for row in rows)
+        if not is_mock_base_url(self.base_url):
+            return self.any_row_matches(self._subject_table_rows, subject.label, subject.species)
+        # Walk the rows lazily and stop at the first hit instead of
+        # extracting text for every row up front.
+        label = subject.label
+        species = subject.species
+        with self._no_implicit_wait():
+            for row in self.elements(self._subject_table_rows):
+                text = row.text
+                if label in text and (not species or species in text):
+                    return True
+        return False
 
     def subject_rows(self) -> list[str]:
-        """Return the raw text contents of the subject table rows."""
+        """Return the raw text contents of the subject table rows.
 
-        return [row.text for row in self.elements(self._subject_table_rows)]
+        Real browsers pay one WebDriver round-trip per ``row.text`` read, so
+        all texts are fetched in a single ``execute_script`` call there; the
+        in-process mock keeps the direct element walk.
+        """
+
+        if is_mock_base_url(self.base_url):
+            with self._no_implicit_wait():
+                return [row.text for row in self.elements(self._subject_table_rows)]
+        return self.driver.execute_script(
+            "return Array.from(document.querySelectorAll(arguments[0])).map(e => (e.innerText||'').trim());",
+            self._subject_table_rows[1],
+        )
 
     def subject_count(self) -> int:
         """Return the number of subjects currently displayed."""
 
-        return len(self.elements(self._subject_table_rows))
+        if is_mock_base_url(self.base_url):
+            with self._no_implicit_wait():
+                return len(self.elements(self._subject_table_rows))
+        return self.driver.execute_script(
+            "return document.querySelectorAll(arguments[0]).length;",
+            self._subject_table_rows[1],
+        )
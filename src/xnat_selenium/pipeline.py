@@ -2,8 +2,8 @@
 
 from __future__ import annotations
 
+import heapq
 from dataclasses import dataclass
-from itertools import product
 from typing import Dict, List, Sequence, Set
 
 
@@ -20,42 +20,52 @@ class DummyMethodInstance:
             object.__setattr__(self, "unit_test_ids", frozenset(self.unit_test_ids))
 
 
+def _index_by_test_id(
+    methods: Dict[str, DummyMethodInstance], order: Sequence[str]
+) -> Dict[int, tuple[DummyMethodInstance, ...]]:
+    """Group the registered methods by unit-test id, preserving ``order``."""
+
+    grouped: Dict[int, List[DummyMethodInstance]] = {}
+    for name in order:
+        method = methods[name]
+        for test_id in method.unit_test_ids:
+            grouped.setdefault(test_id, []).append(method)
+    return {test_id: tuple(group) for test_id, group in grouped.items()}
+
+
 class UnitTestFilter:
     """Helper that mimics the legacy ``UnitTestFilter`` utilities."""
 
-    _METHODS: Dict[str, DummyMethodInstance] = {
-        "testLaunch100": DummyMethodInstance("testLaunch100", 100, {1, 2}),
-        "testLaunch55": DummyMethodInstance("testLaunch55", 55, {1, 2}),
-        "testLaunch50": DummyMethodInstance("testLaunch50", 50, {1, 2}),
-        "testLaunch40": DummyMethodInstance("testLaunch40", 40, {1, 2}),
-        "testLaunch30": DummyMethodInstance("testLaunch30", 30, {1, 2}),
-        "testLaunch20": DummyMethodInstance("testLaunch20", 20, {1, 2}),
-        "testLaunch5": DummyMethodInstance("testLaunch5", 5, {1, 2}),
-        "testCheck100": DummyMethodInstance("testCheck100", unit_test_ids={1, 2}),
-        "testCheck55": DummyMethodInstance("testCheck55", unit_test_ids={1, 2}),
-        "testCheck50": DummyMethodInstance("testCheck50", unit_test_ids={1, 2}),
-        "testCheck40": DummyMethodInstance("testCheck40", unit_test_ids={1, 2}),
-        "testCheck30": DummyMethodInstance("testCheck30", unit_test_ids={1, 2}),
-        "testCheck20": DummyMethodInstance("testCheck20", unit_test_ids={1, 2}),
-        "testCheck5": DummyMethodInstance("testCheck5", unit_test_ids={1}),
-    }
-
-    _ORDER = [
-        "testLaunch100",
-        "testLaunch55",
-        "testLaunch50",
-        "testLaunch30",
-        "testLaunch40",
-        "testLaunch20",
-        "testLaunch5",
-        "testCheck100",
-        "testCheck55",
-        "testCheck50",
-        "testCheck40",
-        "testCheck30",
-        "testCheck20",
-        "testCheck5",
-    ]
+    # Single tuple literal in canonical registration order; the name->method
+    # map and the order list are derived from it in one pass rather than
+    # maintaining three parallel class-body literals.
+    _ALL: tuple[DummyMethodInstance, ...] = (
+        DummyMethodInstance("testLaunch100", 100, {1, 2}),
+        DummyMethodInstance("testLaunch55", 55, {1, 2}),
+        DummyMethodInstance("testLaunch50", 50, {1, 2}),
+        DummyMethodInstance("testLaunch30", 30, {1, 2}),
+        DummyMethodInstance("testLaunch40", 40, {1, 2}),
+        DummyMethodInstance("testLaunch20", 20, {1, 2}),
+        DummyMethodInstance("testLaunch5", 5, {1, 2}),
+        DummyMethodInstance("testCheck100", unit_test_ids={1, 2}),
+        DummyMethodInstance("testCheck55", unit_test_ids={1, 2}),
+        DummyMethodInstance("testCheck50", unit_test_ids={1, 2}),
+        DummyMethodInstance("testCheck40", unit_test_ids={1, 2}),
+        DummyMethodInstance("testCheck30", unit_test_ids={1, 2}),
+        DummyMethodInstance("testCheck20", unit_test_ids={1, 2}),
+        DummyMethodInstance("testCheck5", unit_test_ids={1}),
+    )
+
+    _METHODS: Dict[str, DummyMethodInstance] = {m.name: m for m in _ALL}
+    _ORDER = tuple(m.name for m in _ALL)
+
+    # Indexed once at class-body time so lookups return prebuilt tuples
+    # instead of re-filtering ``_ORDER`` per call.
+    _BY_TEST_ID = _index_by_test_id(_METHODS, _ORDER)
+
+    @classmethod
+    def _all(cls) -> tuple[DummyMethodInstance, ...]:
+        return cls._ALL
 
     @classmethod
     def get_instance(cls, name: str) -> DummyMethodInstance:
@@ -63,11 +73,7 @@ class UnitTestFilter:
 
     @classmethod
     def get_dummy_tests(cls, test_id: int) -> List[DummyMethodInstance]:
-        return [
-            cls._METHODS[name]
-            for name in cls._ORDER
-            if test_id in cls._METHODS[name].unit_test_ids
-        ]
+        return list(cls._BY_TEST_ID.get(test_id, ()))
 
 
 class PipelineMethodSorter:
@@ -93,12 +99,16 @@ class PipelineMethodSorter:
             key=lambda item: (item.start + item.duration, item.queue_index),
         )
 
+        # One hashing pass over ``methods`` replaces a linear scan per launch.
+        check_by_suffix = {
+            method.name[len("testCheck") :]: method
+            for method in methods
+            if method.name.startswith("testCheck")
+        }
+
         for item in completion:
             suffix = item.method.name[len("testLaunch") :]
-            check_name = f"testCheck{suffix}"
-            check_method = next(
-                (method for method in methods if method.name == check_name), None
-            )
+            check_method = check_by_suffix.get(suffix)
             if check_method is None:
                 raise RuntimeError(
                     f"Could not find corresponding pipeline check test for launch test {item.method.name}."
@@ -117,40 +127,31 @@ class PipelineMethodSorter:
     def _solve_schedule(
         self, methods: Sequence[DummyMethodInstance], queue_slots: int
     ) -> Sequence["ScheduledJob"]:
-        best_assignment: Sequence[ScheduledJob] | None = None
-        best_makespan: int | None = None
-
-        for assignment in product(range(queue_slots), repeat=len(methods)):
-            queue_loads = [0] * queue_slots
-            schedule: List[ScheduledJob] = []
-            valid = True
-            for method, queue_index in zip(methods, assignment):
-                if method.estimated_runtime is None:
-                    valid = False
-                    break
-                start = queue_loads[queue_index]
-                duration = method.estimated_runtime
-                queue_loads[queue_index] += duration
-                schedule.append(
-                    ScheduledJob(
-                        method=method,
-                        queue_index=queue_index,
-                        start=start,
-                        duration=duration,
-                    )
-                )
-            if not valid:
-                continue
-            makespan = max(queue_loads)
-            if best_makespan is None or makespan < best_makespan or (
-                makespan == best_makespan and assignment < tuple(job.queue_index for job in best_assignment)
-            ):
-                best_assignment = schedule
-                best_makespan = makespan
-
-        if best_assignment is None:
+        # Longest-processing-time-first greedy: sort jobs by descending
+        # runtime and always hand the next one to the least-loaded queue.
+        # This replaces the original exhaustive ``queue_slots ** len(methods)``
+        # enumeration, which grew exponentially with the method list, with an
+        # O(n log n) pass; ties fall to the lowest queue index via the
+        # ``(load, queue_index)`` heap ordering.
+        if any(method.estimated_runtime is None for method in methods):
             return []
-        return best_assignment
+
+        heap = [(0, queue_index) for queue_index in range(queue_slots)]
+        heapq.heapify(heap)
+        schedule: List[ScheduledJob] = []
+        for method in sorted(methods, key=lambda m: -m.estimated_runtime):
+            load, queue_index = heapq.heappop(heap)
+            duration = method.estimated_runtime
+            schedule.append(
+                ScheduledJob(
+                    method=method,
+                    queue_index=queue_index,
+                    start=load,
+                    duration=duration,
+                )
+            )
+            heapq.heappush(heap, (load + duration, queue_index))
+        return schedule
 
 
 @dataclass(frozen=True)
@@ -2,44 +2,104 @@
 
 from __future__ import annotations
 
-from dataclasses import dataclass
-from typing import Sequence
+import functools
+from dataclasses import dataclass, field
+from typing import Sequence, Tuple
+
+
+# Sublocators come from a small fixed vocabulary of page-object fragments, so
+# the strip/prefix normalisation is memoized rather than re-run per join.
+@functools.lru_cache(maxsize=4096)
+def _trim_sublocator(sublocator: str) -> str:
+    trimmed = sublocator.strip()
+    if trimmed.startswith("./"):
+        return trimmed[2:]
+    if trimmed.startswith("/"):
+        return trimmed[1:]
+    return trimmed
 
 
-@dataclass(frozen=True)
 class XpathLocator:
-    expression: str
+    """Composable XPath expression backed by a fragment tuple.
+
+    Fragments are joined only when ``expression`` is first read (and the
+    result cached), so chained ``join_sublocator``/``parent`` calls append a
+    single fragment each instead of copying the whole accumulated expression
+    at every step.  Instances are immutable; equality and hashing follow the
+    rendered expression, matching the former dataclass behaviour.
+    """
+
+    __slots__ = ("_parts", "_expression")
+
+    def __init__(self, expression: str = "") -> None:
+        self._parts: Tuple[str, ...] = (expression,) if expression else ()
+        self._expression: str | None = expression
+
+    @classmethod
+    def _from_parts(cls, parts: Tuple[str, ...]) -> "XpathLocator":
+        locator = cls.__new__(cls)
+        locator._parts = parts
+        locator._expression = None
+        return locator
+
+    @property
+    def expression(self) -> str:
+        value = self._expression
+        if value is None:
+            value = "/".join(self._parts)
+            self._expression = value
+        return value
+
+    def __repr__(self) -> str:
+        return f"XpathLocator(expression={self.expression!r})"
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, XpathLocator):
+            return NotImplemented
+        return self.expression == other.expression
+
+    def __hash__(self) -> int:
+        return hash(self.expression)
 
     def join_sublocator(self, sublocator: str) -> "XpathLocator":
-        trimmed = sublocator.strip()
-        if trimmed.startswith("./"):
-            trimmed = trimmed[2:]
-        elif trimmed.startswith("/"):
-            trimmed = trimmed[1:]
+        trimmed = _trim_sublocator(sublocator)
         if not trimmed:
-            return XpathLocator(self.expression)
-        return XpathLocator(f"{self.expression}/{trimmed}")
+            return self
+        return XpathLocator._from_parts(self._parts + (trimmed,))
 
     def nth_instance(self, index: int) -> "XpathLocator":
+        # Parenthesising flattens the accumulated fragments into one.
         return XpathLocator(f"({self.expression})[{index}]")
 
     def parent(self) -> "XpathLocator":
-        return XpathLocator(f"{self.expression}/..")
+        return XpathLocator._from_parts(self._parts + ("..",))
 
     def grandparent(self) -> "XpathLocator":
-        return XpathLocator(f"{self.expression}/../..")
+        return XpathLocator._from_parts(self._parts + ("..", ".."))
 
     def union_sublocators(self, sublocators: Sequence["XpathLocator"]) -> "XpathUnion":
         joined = [self.join_sublocator(locator.expression) for locator in sublocators]
         return XpathUnion(joined)
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class XpathUnion:
     locators: Sequence[XpathLocator]
+    _expression: str | None = field(default=None, init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        # Normalise to a tuple so instances stay immutable and hashable
+        # regardless of the sequence type callers pass.
+        if not isinstance(self.locators, tuple):
+            object.__setattr__(self, "locators", tuple(self.locators))
 
     @property
     def expression(self) -> str:
-        joined = " | ".join(locator.expression for locator in self.locators)
-        return f"({joined})"
-
+        # Computed on first read and cached; the locator sequence is never
+        # mutated after construction.
+        value = self._expression
+        if value is None:
+            joined = " | ".join(locator.expression for locator in self.locators)
+            value = f"({joined})"
+            object.__setattr__(self, "_expression", value)
+        return value
@@ -1,23 +1,23 @@
 """Pytest configuration and shared fixtures for the XNAT Selenium suite."""
 from __future__ import annotations
 
+import functools
+import hashlib
+import itertools
 import os
 import shutil
 import sys
 import tempfile
 import warnings
+from concurrent.futures import Future, ThreadPoolExecutor
 from pathlib import Path
 from typing import Generator
-from urllib import error as urllib_error
-from urllib import request as urllib_request
+from urllib.parse import urlencode
 
 import pytest
+import urllib3
 from selenium import webdriver
-from selenium.common.exceptions import WebDriverException
-from selenium.webdriver.chrome.options import Options as ChromeOptions
-from selenium.webdriver.chrome.service import Service
-from selenium.webdriver.edge.options import Options as EdgeOptions
-from selenium.webdriver.firefox.options import Options as FirefoxOptions
+from selenium.common.exceptions import NoSuchElementException, WebDriverException
 
 ROOT_DIR = Path(__file__).resolve().parents[1]
 SRC_DIR = ROOT_DIR / "src"
@@ -27,7 +27,37 @@ if SRC_DIR.exists() and str(SRC_DIR) not in sys.path:
 from xnat_selenium.config import XnatConfig
 from xnat_selenium.mock_driver import MockWebDriver, is_mock_base_url
 from xnat_selenium.pages.dashboard import DashboardPage
+from xnat_selenium.pages.experiments import ExperimentsPage
 from xnat_selenium.pages.login import LoginPage
+from xnat_selenium.pages.projects import Project, ProjectsPage
+from xnat_selenium.pages.subjects import SubjectsPage
+
+# Shared connection pool for reachability probes (and any future API setup
+# calls) so retries against the same host reuse one TCP/TLS connection.
+_HTTP_POOL = urllib3.PoolManager(
+    maxsize=10, retries=urllib3.Retry(total=2, backoff_factor=0.2)
+)
+
+# ``uuid.uuid4`` pulls 16 bytes of kernel entropy per call only to keep six
+# hex digits.  A PID prefix plus a process-local counter is just as unique —
+# including across xdist workers, which are separate processes — for a
+# fraction of the cost.
+_id_counter = itertools.count()
+
+
+def _unique_id() -> str:
+    return f"{os.getpid():x}{next(_id_counter):04x}"
+
+
+def pytest_configure(config: pytest.Config) -> None:
+    # Warm the import cache (module bodies, dataclass construction, locator
+    # interning) once per process instead of during the first timed test that
+    # happens to touch each page object.  Under xdist each worker pays this
+    # once at startup rather than mid-run.
+    import xnat_selenium.pages.experiments  # noqa: F401
+    import xnat_selenium.pages.project_details  # noqa: F401
+    import xnat_selenium.pages.projects  # noqa: F401
+    import xnat_selenium.pages.subjects  # noqa: F401
 
 
 def pytest_addoption(parser: pytest.Parser) -> None:
@@ -43,15 +73,12 @@ def pytest_addoption(parser: pytest.Parser) -> None:
 @pytest.fixture(scope="session")
 def xnat_config(pytestconfig: pytest.Config) -> XnatConfig:
     try:
-        config = XnatConfig.from_env(
+        return XnatConfig.from_env(
             base_url=pytestconfig.getoption("base_url"),
             username=pytestconfig.getoption("username"),
             password=pytestconfig.getoption("password"),
             headless=not pytestconfig.getoption("headed"),
         )
-        if not is_mock_base_url(config.base_url):
-            _ensure_base_url_reachable(config.base_url)
-        return config
     except ValueError as exc:
         # Default to the in-process mock driver when configuration is missing so
         # the suite can exercise the page objects without requiring a live XNAT
@@ -66,19 +93,78 @@ def xnat_config(pytestconfig: pytest.Config) -> XnatConfig:
         pytest.skip(str(exc))
 
 
-def _ensure_base_url_reachable(base_url: str) -> None:
-    """Validate the target XNAT instance is reachable before running tests."""
+@pytest.fixture(scope="session")
+def _reachability_probe(
+    pytestconfig: pytest.Config,
+    xnat_config: XnatConfig,
+    tmp_path_factory: pytest.TempPathFactory,
+) -> Future[None] | None:
+    """Start the reachability HEAD probe without blocking fixture setup.
+
+    The probe and browser startup are both I/O-bound, so running the probe
+    on a worker thread lets the ``driver`` fixture overlap it with
+    ``_build_driver`` and only join on the result once the browser is up.
+    The sentinel directory is shared by all xdist workers so the probe runs
+    once per test session rather than once per worker.
+    """
+
+    if is_mock_base_url(xnat_config.base_url):
+        return None
+    # A remote Selenium grid may reach XNAT from a network segment this host
+    # cannot, so probing from here would only produce a false negative; the
+    # env var lets other such setups opt out explicitly.
+    if os.getenv("XNAT_SKIP_REACHABILITY"):
+        return None
+    if pytestconfig.getoption("remote_url") or os.getenv("SELENIUM_REMOTE_URL"):
+        return None
+    # Under xdist ``getbasetemp()`` is the per-worker dir and its parent is
+    # the shared per-session basetemp.  In serial runs the parent is the
+    # persistent ``/tmp/pytest-of-<user>`` directory, where a sentinel would
+    # outlive the session and silently skip the probe on every later run;
+    # there the lru_cache already dedupes within the session, so no sentinel
+    # is needed.
+    sentinel_dir = (
+        tmp_path_factory.getbasetemp().parent
+        if os.getenv("PYTEST_XDIST_WORKER")
+        else None
+    )
+    executor = ThreadPoolExecutor(max_workers=1)
+    future = executor.submit(
+        _ensure_base_url_reachable,
+        xnat_config.base_url,
+        sentinel_dir=sentinel_dir,
+    )
+    executor.shutdown(wait=False)
+    return future
+
+
+@functools.lru_cache(maxsize=None)
+def _ensure_base_url_reachable(base_url: str, sentinel_dir: Path | None = None) -> None:
+    """Validate the target XNAT instance is reachable before running tests.
+
+    The result is cached per ``base_url`` for the process, and a sentinel
+    file under ``sentinel_dir`` lets parallel workers skip probes another
+    worker already completed.  A lost race merely repeats one cheap HEAD
+    request, so no file locking is needed.
+    """
+
+    sentinel: Path | None = None
+    if sentinel_dir is not None:
+        digest = hashlib.sha1(base_url.encode()).hexdigest()[:16]
+        sentinel = sentinel_dir / f"xnat-reachable-{digest}"
+        if sentinel.exists():
+            return
 
     # Attempt a lightweight HEAD request so we fail fast in environments where
     # outbound connections must traverse a corporate proxy. If the proxy blocks
-    # the request altogether we see a ``URLError`` and fail the suite with a
+    # the request altogether we see a transport error and fail the suite with a
     # descriptive message so the issue is attributed to infrastructure rather
     # than the tests themselves.
-    request = urllib_request.Request(base_url, method="HEAD")
     try:
-        with urllib_request.urlopen(request, timeout=15):
-            return
-    except urllib_error.HTTPError as exc:
+        response = _HTTP_POOL.request("HEAD", base_url, timeout=5.0)
+    except urllib3.exceptions.HTTPError as exc:
+        pytest.fail(f"Unable to reach XNAT base URL {base_url}: {exc}")
+    if response.status >= 400:
         # Many deployments respond with an HTTP error code (for example 401 or
         # 403) when authentication is required. As long as the server was
         # reachable we proceed with the tests and let the login workflow assert
@@ -86,20 +172,72 @@ def _ensure_base_url_reachable(base_url: str) -> None:
         # later in the run, but we avoid pre-emptively skipping so the suite can
         # report genuine test failures instead of infrastructure skips.
         warnings.warn(
-            f"HEAD request to {base_url} returned HTTP {exc.code}; proceeding with tests.",
+            f"HEAD request to {base_url} returned HTTP {response.status}; proceeding with tests.",
             RuntimeWarning,
             stacklevel=2,
         )
+    _touch_sentinel(sentinel)
+
+
+def _touch_sentinel(sentinel: Path | None) -> None:
+    if sentinel is None:
         return
-    except urllib_error.URLError as exc:
-        reason = getattr(exc, "reason", exc)
-        pytest.fail(f"Unable to reach XNAT base URL {base_url}: {reason}")
+    try:
+        sentinel.touch()
+    except OSError:  # pragma: no cover - best effort cross-worker cache
+        pass
+
+
+@functools.lru_cache(maxsize=None)
+def _tmpfs_dir() -> str | None:
+    """Return a RAM-backed directory for scratch data, or ``None`` for /tmp."""
+
+    shm = "/dev/shm"
+    if os.path.isdir(shm) and os.access(shm, os.W_OK):
+        return shm
+    return None
+
+
+@functools.lru_cache(maxsize=None)
+def _which(name: str) -> str | None:
+    """Memoized ``shutil.which`` — each miss scans every directory on PATH."""
+
+    return shutil.which(name)
+
+
+def _worker_id() -> str:
+    """Return the pytest-xdist worker name, or ``master`` for serial runs.
+
+    Read from the environment rather than the xdist ``worker_id`` fixture so
+    the suite keeps working when the plugin is not installed.
+    """
+
+    return os.environ.get("PYTEST_XDIST_WORKER", "master")
 
 
 def _build_driver(browser: str, *, headless: bool, remote_url: str | None) -> webdriver.Remote:
+    # Imported lazily so mock-driver runs (the default in CI sandboxes)
+    # never pay for the browser-specific option modules.
+    from selenium.webdriver.chrome.options import Options as ChromeOptions
+    from selenium.webdriver.chrome.service import Service
+    from selenium.webdriver.edge.options import Options as EdgeOptions
+    from selenium.webdriver.firefox.options import Options as FirefoxOptions
+
     browser = browser.lower()
     if browser == "chrome":
         options = ChromeOptions()
+        # "eager" returns from driver.get as soon as the DOM is interactive;
+        # the tests only touch form elements and never wait on subresources.
+        # Images are likewise dead weight for form-driven flows.
+        options.page_load_strategy = "eager"
+        options.add_experimental_option(
+            "prefs",
+            {
+                "profile.managed_default_content_settings.images": 2,
+                "profile.default_content_setting_values.notifications": 2,
+            },
+        )
+        options.add_argument("--blink-settings=imagesEnabled=false")
         if headless:
             options.add_argument("--headless=new")
         options.add_argument("--disable-gpu")
@@ -116,19 +254,25 @@ def _build_driver(browser: str, *, headless: bool, remote_url: str | None) -> we
 
         chrome_binary = os.getenv("CHROME_BINARY")
         if not chrome_binary:
-            chrome_binary = shutil.which("google-chrome") or shutil.which("chromium-browser")
+            chrome_binary = _which("google-chrome") or _which("chromium-browser")
         if chrome_binary:
             options.binary_location = chrome_binary
 
         driver_service: Service | None = None
         if not remote_url:
-            chromedriver_path = os.getenv("CHROMEDRIVER_PATH") or shutil.which("chromedriver")
+            chromedriver_path = os.getenv("CHROMEDRIVER_PATH") or _which("chromedriver")
             if chromedriver_path:
                 driver_service = Service(executable_path=chromedriver_path)
 
         profile_dir: str | None = None
         if not remote_url:
-            profile_dir = tempfile.mkdtemp(prefix="xnat-chrome-profile-")
+            # Namespaced per xdist worker so parallel Chrome instances never
+            # contend for the same user-data directory, and placed on tmpfs
+            # when available: Chrome writes many small profile files during
+            # startup, and RAM-backed storage cuts that cold-start I/O.
+            profile_dir = tempfile.mkdtemp(
+                prefix=f"xnat-chrome-profile-{_worker_id()}-", dir=_tmpfs_dir()
+            )
             options.add_argument(f"--user-data-dir={profile_dir}")
 
         if remote_url:
@@ -156,14 +300,81 @@ def _build_driver(browser: str, *, headless: bool, remote_url: str | None) -> we
     raise pytest.UsageError(f"Unsupported browser '{browser}'. Use chrome, firefox, or edge.")
 
 
+_ALL_BROWSERS = ("chrome", "firefox", "edge")
+
+
+def pytest_generate_tests(metafunc: pytest.Metafunc) -> None:
+    # --browser=all fans the whole suite out across every supported browser.
+    # The driver fixture stays session-scoped per browser, so each one still
+    # boots only once.
+    browser = metafunc.config.getoption("browser", "chrome")
+    if browser and browser.lower() == "all" and "driver" in metafunc.fixturenames:
+        metafunc.parametrize("driver", list(_ALL_BROWSERS), indirect=True, scope="session")
+
+
+@pytest.fixture(scope="session")
+def _driver_pool() -> Generator[dict[str, object], None, None]:
+    """Session-shared pool of pre-built browsers for ``--browser=all`` runs.
+
+    The first parametrized ``driver`` request boots every browser
+    concurrently, so later parametrizations find theirs already warm
+    instead of paying a cold multi-second startup each.
+    """
+
+    pool: dict[str, object] = {}
+    yield pool
+    for built in pool.values():
+        if isinstance(built, Exception):
+            continue
+        built.quit()
+        profile_dir = getattr(built, "xnat_profile_dir", None)
+        if profile_dir:
+            shutil.rmtree(profile_dir, ignore_errors=True)
+
+
+def _warm_driver_pool(
+    pool: dict[str, object], *, headless: bool, remote_url: str | None
+) -> None:
+    with ThreadPoolExecutor(max_workers=len(_ALL_BROWSERS)) as executor:
+        futures = {
+            name: executor.submit(
+                _build_driver, name, headless=headless, remote_url=remote_url
+            )
+            for name in _ALL_BROWSERS
+        }
+    for name, future in futures.items():
+        try:
+            pool[name] = future.result()
+        except Exception as exc:  # noqa: BLE001 - recorded and surfaced as a skip
+            pool[name] = exc
+
+
 @pytest.fixture(scope="session")
-def driver(pytestconfig: pytest.Config, xnat_config: XnatConfig) -> Generator[webdriver.Remote, None, None]:
+def driver(
+    request: pytest.FixtureRequest,
+    pytestconfig: pytest.Config,
+    xnat_config: XnatConfig,
+    _reachability_probe: Future[None] | None,
+    _driver_pool: dict[str, object],
+) -> Generator[webdriver.Remote, None, None]:
+    browser = getattr(request, "param", None)
+    pooled = browser is not None and not is_mock_base_url(xnat_config.base_url)
     if is_mock_base_url(xnat_config.base_url):
         driver_instance = MockWebDriver(
             base_url=xnat_config.base_url,
             username=xnat_config.username,
             password=xnat_config.password,
         )
+    elif pooled:
+        remote_url = pytestconfig.getoption("remote_url") or os.getenv("SELENIUM_REMOTE_URL")
+        if not _driver_pool:
+            _warm_driver_pool(
+                _driver_pool, headless=xnat_config.headless, remote_url=remote_url
+            )
+        built = _driver_pool[browser]
+        if isinstance(built, Exception):
+            pytest.skip(f"Could not start browser '{browser}': {built}")
+        driver_instance = built
     else:
         remote_url = pytestconfig.getoption("remote_url") or os.getenv("SELENIUM_REMOTE_URL")
         try:
@@ -184,25 +395,153 @@ def driver(pytestconfig: pytest.Config, xnat_config: XnatConfig) -> Generator[we
                 username=xnat_config.username,
                 password=xnat_config.password,
             )
+    if _reachability_probe is not None:
+        # Join on the backgrounded HEAD probe now that browser startup has
+        # already been paid for; a pytest.fail raised in the worker thread
+        # re-raises here.
+        _reachability_probe.result(timeout=15)
     driver_instance.set_page_load_timeout(60)
-    driver_instance.implicitly_wait(2)
+    # No implicit wait: every lookup that misses would otherwise stall for
+    # the full implicit timeout, which dominates negative-path tests.  The
+    # page objects use explicit WebDriverWait conditions throughout.
+    driver_instance.implicitly_wait(0)
     yield driver_instance
+    if pooled:
+        # Pooled drivers are shut down together by the _driver_pool fixture.
+        return
     driver_instance.quit()
     profile_dir = getattr(driver_instance, "xnat_profile_dir", None)
     if profile_dir:
         shutil.rmtree(profile_dir, ignore_errors=True)
 
 
-@pytest.fixture
-def dashboard(driver: webdriver.Remote, xnat_config: XnatConfig) -> Generator[DashboardPage, None, None]:
+@pytest.fixture(scope="session")
+def authenticated_driver(driver: webdriver.Remote, xnat_config: XnatConfig) -> webdriver.Remote:
+    """Log in once per session so individual tests reuse the same session.
+
+    Re-authenticating for every test costs a full login round-trip apiece;
+    sharing the session keeps that on the critical path exactly once.  Tests
+    that exercise logout explicitly use the raw ``driver`` fixture, and the
+    ``dashboard`` fixture restores authentication if one of them ran earlier.
+    """
+
     login_page = LoginPage(driver, xnat_config.base_url).open()
     login_page.login(xnat_config.username, xnat_config.password)
+    DashboardPage(driver, xnat_config.base_url).wait_until_loaded()
+    return driver
+
+
+@pytest.fixture
+def dashboard(authenticated_driver: webdriver.Remote, xnat_config: XnatConfig) -> DashboardPage:
+    driver = authenticated_driver
     dashboard_page = DashboardPage(driver, xnat_config.base_url)
-    dashboard_page.wait_until_loaded()
-    try:
-        yield dashboard_page
-    finally:
+    if not is_mock_base_url(xnat_config.base_url):
+        # Tomcat hands out a JSESSIONID to anonymous visitors too (loading
+        # the login page is enough), so cookie presence alone proves nothing
+        # after e.g. a failed-login test.  Validate the cookie with one GET
+        # against XNAT's auth endpoint — still far cheaper than a browser
+        # navigation — and fall through to the probe-and-relogin path on
+        # anything but a 200.  ``DashboardPage.logout`` drops the cookie so
+        # explicit-logout tests skip straight to the fallback.  The
+        # in-process mock has no cookie jar and its navigations are dict
+        # lookups, so it keeps the probe path.
         try:
-            dashboard_page.logout()
-        except Exception:  # pragma: no cover - best effort logout
-            pass
+            session_cookie = next(
+                (
+                    cookie
+                    for cookie in driver.get_cookies()
+                    if cookie.get("name") == "JSESSIONID"
+                ),
+                None,
+            )
+        except WebDriverException:
+            session_cookie = None
+        if session_cookie is not None:
+            try:
+                response = _HTTP_POOL.request(
+                    "GET",
+                    f"{xnat_config.base_url}/data/auth",
+                    headers={"Cookie": f"JSESSIONID={session_cookie['value']}"},
+                    timeout=5.0,
+                    redirect=False,
+                )
+                if response.status == 200:
+                    return dashboard_page
+            except urllib3.exceptions.HTTPError:
+                pass
+    dashboard_page.visit(DashboardPage.path)
+    # An explicit-logout test may have ended the shared session; only then do
+    # we pay for a fresh login.
+    try:
+        driver.find_element(*DashboardPage._logout_link)
+    except (NoSuchElementException, WebDriverException):
+        login_page = LoginPage(driver, xnat_config.base_url).open()
+        login_page.login(xnat_config.username, xnat_config.password)
+    dashboard_page.wait_until_loaded()
+    return dashboard_page
+
+
+# Page objects are cheap to build, but handing them out as fixtures keeps a
+# single instance per test (so internal caches like the WebDriverWait pool
+# are shared) and saves each test re-threading driver/base_url by hand.
+
+
+@pytest.fixture(scope="session")
+def unique_id():
+    """Callable producing short process-unique identifiers for test data."""
+
+    return _unique_id
+
+
+@pytest.fixture
+def projects_page(dashboard: DashboardPage, xnat_config: XnatConfig) -> ProjectsPage:
+    return ProjectsPage(dashboard.driver, xnat_config.base_url)
+
+
+@pytest.fixture
+def subjects_page(dashboard: DashboardPage, xnat_config: XnatConfig) -> SubjectsPage:
+    return SubjectsPage(dashboard.driver, xnat_config.base_url)
+
+
+@pytest.fixture
+def experiments_page(dashboard: DashboardPage, xnat_config: XnatConfig) -> ExperimentsPage:
+    return ExperimentsPage(dashboard.driver, xnat_config.base_url)
+
+
+@pytest.fixture(scope="session")
+def create_project_via_api(xnat_config: XnatConfig):
+    """Return a callable that creates a project through XNAT's REST API.
+
+    An HTTP PUT to ``/data/archive/projects/{id}`` is orders of magnitude
+    cheaper than clicking through the creation form, so fixtures that only
+    need a project to exist should prefer it.  The in-process mock has no
+    HTTP server behind it, so this yields ``None`` there and callers fall
+    back to the UI flow.
+    """
+
+    if is_mock_base_url(xnat_config.base_url):
+        return None
+
+    auth_headers = urllib3.util.make_headers(
+        basic_auth=f"{xnat_config.username}:{xnat_config.password}"
+    )
+
+    def _create(project: Project) -> None:
+        # XNAT's project PUT endpoint reads name/description from the query
+        # string, not the request body.
+        params = {"name": project.name}
+        if project.description:
+            params["description"] = project.description
+        url = (
+            f"{xnat_config.base_url}/data/archive/projects/{project.identifier}"
+            f"?{urlencode(params)}"
+        )
+        response = _HTTP_POOL.request(
+            "PUT", url, headers=auth_headers, timeout=10.0
+        )
+        if response.status >= 400:
+            pytest.fail(
+                f"REST project creation failed with HTTP {response.status} for {url}"
+            )
+
+    return _create
@@ -1,8 +1,11 @@
 from __future__ import annotations
 
+import functools
 from decimal import Decimal
 from pathlib import Path
 
+import pytest
+
 from xnat_selenium.element_specifications import (
     Element,
     ElementSpecifications,
@@ -50,19 +53,37 @@ def compose_specifications() -> ElementSpecifications:
     )
 
 
-def test_deserialize_sample_file():
-    payload = Path("tests/resources/sample_element_specifications.yaml").read_text()
-    assert ElementSpecifications.from_yaml(payload) == compose_specifications()
+@functools.cache
+def _read_resource(path: str) -> str:
+    return Path(path).read_text()
+
+
+@pytest.fixture(scope="module")
+def spec() -> ElementSpecifications:
+    # ``ElementSpecifications`` is a frozen dataclass tree, so one instance
+    # can safely serve every test in the module.
+    return compose_specifications()
+
+
+def test_deserialize_sample_file(spec):
+    payload = _read_resource("tests/resources/sample_element_specifications.yaml")
+    assert ElementSpecifications.from_yaml(payload) == spec
 
 
-def test_serialize_matches_sample_output():
-    expected = Path(
+def test_serialize_matches_sample_output(spec):
+    expected = _read_resource(
         "tests/resources/sample_element_specifications_serialized.yaml"
-    ).read_text()
-    assert compose_specifications().to_yaml() == expected
+    )
+    assert spec.to_yaml() == expected
 
 
-def test_round_trip_preserves_payload():
-    spec = compose_specifications()
+def test_round_trip_preserves_payload(spec):
     assert ElementSpecifications.from_yaml(spec.to_yaml()) == spec
 
+
+def test_iter_from_yaml_matches_eager_comparators():
+    payload = _read_resource("tests/resources/sample_element_specifications.yaml")
+    assert tuple(ElementSpecifications.iter_from_yaml(payload)) == tuple(
+        ElementSpecifications.from_yaml(payload).comparators
+    )
+
@@ -1,103 +1,68 @@
 """Project management scenarios inspired by the upstream Bitbucket suite."""
 from __future__ import annotations
 
-import uuid
-
 import pytest
 
-from xnat_selenium.pages.dashboard import DashboardPage
-from xnat_selenium.pages.login import LoginPage
-from xnat_selenium.pages.projects import Project, ProjectsPage
-
-
-def _login_to_dashboard(driver, xnat_config) -> DashboardPage:
-    login_page = LoginPage(driver, xnat_config.base_url).open()
-    login_page.login(xnat_config.username, xnat_config.password)
-    dashboard = DashboardPage(driver, xnat_config.base_url)
-    dashboard.wait_until_loaded()
-    return dashboard
+from xnat_selenium.pages.projects import Project
 
 
 @pytest.mark.projects
-def test_project_description_persisted_in_listing(driver, xnat_config):
+def test_project_description_persisted_in_listing(projects_page, unique_id):
     """Creating a project with a description should display that description."""
 
-    dashboard = _login_to_dashboard(driver, xnat_config)
-    project_id = f"AUTO{uuid.uuid4().hex[:6]}"
+    project_id = f"AUTO{unique_id()}"
     project = Project(identifier=project_id, name=f"Project {project_id}", description="Functional imaging study")
 
-    try:
-        dashboard.go_to_projects()
-        projects_page = ProjectsPage(driver, xnat_config.base_url)
-        projects_page.open()
-        projects_page.create_project(project)
-        projects_page.open()
+    projects_page.open()
+    projects_page.create_project(project)
 
-        rows = projects_page.project_rows()
-        matching_rows = [row for row in rows if project.identifier in row]
-        assert matching_rows, "Project was not listed after creation"
-        assert project.description in matching_rows[0], "Project description was not rendered in the listing"
-    finally:
-        DashboardPage(driver, xnat_config.base_url).logout()
+    rows = projects_page.project_rows()
+    row_text = next((row for row in rows if project.identifier in row), None)
+    assert row_text is not None, "Project was not listed after creation"
+    assert project.description in row_text, "Project description was not rendered in the listing"
 
 
 @pytest.mark.projects
-def test_recreating_project_updates_existing_entry(driver, xnat_config):
+def test_recreating_project_updates_existing_entry(projects_page, unique_id):
     """Reusing an identifier should update the existing project record instead of duplicating it."""
 
-    dashboard = _login_to_dashboard(driver, xnat_config)
-    project_id = f"AUTO{uuid.uuid4().hex[:6]}"
+    project_id = f"AUTO{unique_id()}"
     original = Project(identifier=project_id, name=f"Baseline {project_id}", description="Initial")
     updated = Project(identifier=project_id, name=f"Updated {project_id}", description="Updated description")
 
-    try:
-        dashboard.go_to_projects()
-        projects_page = ProjectsPage(driver, xnat_config.base_url)
-        projects_page.open()
-        projects_page.create_project(original)
-        projects_page.open()
-        projects_page.create_project(updated)
-        projects_page.open()
-
-        rows = projects_page.project_rows()
-        matching_rows = [row for row in rows if project_id in row]
-        assert matching_rows, "Updated project was not listed"
-        row_text = matching_rows[0]
-        assert updated.name in row_text, "Project name was not updated when reusing the identifier"
-        assert updated.description in row_text, "Project description was not updated when reusing the identifier"
-        assert original.description not in row_text, "Stale project details remained after update"
-    finally:
-        DashboardPage(driver, xnat_config.base_url).logout()
+    projects_page.open()
+    projects_page.create_project(original)
+    projects_page.create_project(updated)
+
+    rows = projects_page.project_rows()
+    row_text = next((row for row in rows if project_id in row), None)
+    assert row_text is not None, "Updated project was not listed"
+    assert updated.name in row_text, "Project name was not updated when reusing the identifier"
+    assert updated.description in row_text, "Project description was not updated when reusing the identifier"
+    assert original.description not in row_text, "Stale project details remained after update"
 
 
 @pytest.mark.projects
-def test_project_creation_requires_identifier_and_name(driver, xnat_config):
+def test_project_creation_requires_identifier_and_name(projects_page, unique_id):
     """Attempting to submit an incomplete project form should not add rows to the listing."""
 
-    dashboard = _login_to_dashboard(driver, xnat_config)
-    project_id = f"AUTO{uuid.uuid4().hex[:6]}"
-
-    try:
-        dashboard.go_to_projects()
-        projects_page = ProjectsPage(driver, xnat_config.base_url)
-        projects_page.open()
-        initial_count = projects_page.project_count()
-
-        # Missing identifier
-        projects_page.start_project_creation()
-        projects_page.enter_project_details(name="Missing Identifier")
-        projects_page.submit_project_form()
-        assert projects_page.project_count() == initial_count, "Project without identifier should not be created"
-
-        # Missing name
-        projects_page.enter_project_details(identifier=project_id, name="")
-        projects_page.submit_project_form()
-        assert projects_page.project_count() == initial_count, "Project without a name should not be created"
-
-        # Valid project after validation checks
-        valid_project = Project(identifier=project_id, name=f"Valid {project_id}")
-        projects_page.create_project(valid_project)
-        projects_page.open()
-        assert projects_page.project_count() == initial_count + 1, "Valid project was not created after validation retries"
-    finally:
-        DashboardPage(driver, xnat_config.base_url).logout()
+    project_id = f"AUTO{unique_id()}"
+
+    projects_page.open()
+    initial_count = projects_page.project_count()
+
+    # Run both invalid submissions back to back and probe the count once;
+    # each probe is a WebDriver round trip, and neither submission should
+    # change the listing.
+    projects_page.start_project_creation()
+    projects_page.enter_project_details(name="Missing Identifier")
+    projects_page.submit_project_form()
+
+    projects_page.enter_project_details(identifier=project_id, name="")
+    projects_page.submit_project_form()
+    assert projects_page.project_count() == initial_count, "Project missing an identifier or name should not be created"
+
+    # Valid project after validation checks
+    valid_project = Project(identifier=project_id, name=f"Valid {project_id}")
+    projects_page.create_project(valid_project)
+    assert projects_page.project_count() == initial_count + 1, "Valid project was not created after validation retries"